@@ -4,46 +4,25 @@ from .model.solution import Solution
 from .heuristics.bottomleft import BottomLeft
 from .heuristics.bottom_left_fill import BottomLeftFill
 from .metaheuristics.ga.ga import GeneticAlgorithm
+from .metaheuristics.ga.islands import IslandModel
 from .metaheuristics.sa import SimulatedAnnealing
+from .metaheuristics.parallel_tempering import ParallelTempering
 
 from .fitness import HeightFitnessEvaluator
 from .constructive_permutation.random_generator import RandomGenerator
 from .constructive_permutation.greedy_generator import GreedyAreaPermutationGenerator
 from .visualizer import Visualizer
+from .evaluation_cache import EvaluationCache
+from .budget import Budget
+from . import instrumentation
 from .utils import *
+from .config import *
 
 
-# CONFIGURATION
-INSTANCE_NAME = "BENG06.ins2D"
-INSTANCE_SHORT = INSTANCE_NAME.split('.')[0].lower()
-DECODER_TYPE = 1   # "1 = BL" or "2 = BLF"
-METAHEURISTIC = "GA" # "SA" or "GA"
-K_REPEAT_RANDOM = 1000
-N_RUNS = 10
-
-RUN_METHODS = {
-    "SA": 0,
-    "GA": 1,
-    "GREEDY": 0,
-    "RANDOM": 0,
-}
-
-ga_parameters = {
-      "population_size": 80,
-      "generations": 300,
-      "mutation_rate": 0.1,
-      "crossover_size": 0.7,
-      "tournament_size": 5
-} 
-
-sa_parameters = {
-      "T0": 50,
-      "T_min": 0.1,
-      "alpha": 0.95,
-      "max_iter": 100,
-}     
-
 def main():
+    if PROFILE:
+        instrumentation.enable()
+
     BASE_DIR = Path(__file__).resolve().parent
     instance_path = BASE_DIR / "data" / "BENG" / INSTANCE_NAME
     output_dir = Path(INSTANCE_SHORT)
@@ -55,19 +34,36 @@ def main():
     print("Name:", INSTANCE_NAME)
     print(f"Bin width: {instance.bin_width}")
     print(f"Number of items: {len(instance.items)}")
+    lower_bound = instance.lower_bound()
+    print(f"Lower bound: {lower_bound}")
     print("Metaheuristic:", METAHEURISTIC)
     decoder = get_decoder(DECODER_TYPE)
     print("Heuristic:", decoder.name)
     fitness = HeightFitnessEvaluator()
     item_ids = [item.id for item in instance.items]
 
+    budget = None
+    if MAX_TIME is not None or MAX_EVALUATIONS is not None:
+        budget = Budget(MAX_TIME, MAX_EVALUATIONS)
+
+    cache = None
+    if CACHE_SIZE:
+        cache_path = output_dir / f"evaluations_{decoder.name}.sqlite" if CACHE_PERSIST else None
+        cache = EvaluationCache(CACHE_SIZE, cache_path)
+
     if RUN_METHODS["GA"] or RUN_METHODS["SA"]:
     # Run the selected metaheuristic
-        if METAHEURISTIC == "SA":
-            best_solution = SimulatedAnnealing.run_sa(instance, decoder, fitness,item_ids, N_RUNS, sa_parameters, INSTANCE_SHORT)
+        if METAHEURISTIC == "SA" and sa_parameters["replicas"] > 1:
+            best_solution = ParallelTempering.run_tempering(instance, decoder, fitness,item_ids, N_RUNS, sa_parameters, INSTANCE_SHORT, cache, SEED, lower_bound, budget)
+
+        elif METAHEURISTIC == "SA":
+            best_solution = SimulatedAnnealing.run_sa(instance, decoder, fitness,item_ids, N_RUNS, sa_parameters, INSTANCE_SHORT, cache, RUN_WORKERS, SEED, budget, lower_bound)
+
+        elif METAHEURISTIC == "GA" and ga_parameters["islands"] > 1:
+            best_solution = IslandModel.run_islands(instance, decoder, fitness,item_ids, N_RUNS, ga_parameters, INSTANCE_SHORT, cache, SEED, lower_bound, budget)
 
         elif METAHEURISTIC == "GA":
-            best_solution = GeneticAlgorithm.run_ga(instance, decoder, fitness,item_ids, N_RUNS, ga_parameters, INSTANCE_SHORT) 
+            best_solution = GeneticAlgorithm.run_ga(instance, decoder, fitness,item_ids, N_RUNS, ga_parameters, INSTANCE_SHORT, cache, WORKERS, RUN_WORKERS, SEED, budget, lower_bound)
         else:
             raise ValueError(f"Unknown metaheuristic: {METAHEURISTIC}")
 
@@ -89,7 +85,7 @@ def main():
         greedy_solution = Solution(greedy_perm)
         greedy_solution.evaluate(instance, decoder, fitness)
 
-        save_greedy_result(greedy_solution.fitness, f"{INSTANCE_SHORT}/greedy_result_{decoder.name}_{INSTANCE_SHORT}.csv", greedy_solution.permutation)
+        save_greedy_result(greedy_solution.fitness, f"{INSTANCE_SHORT}/greedy_result_{decoder.name}_{INSTANCE_SHORT}.csv", greedy_solution.permutation, lower_bound)
 
         print("Greedy area fitness:", greedy_solution.fitness)
         Visualizer.draw_solution(placements=greedy_solution.placements,
@@ -104,16 +100,16 @@ def main():
     if RUN_METHODS["RANDOM"]:
         random_gen = RandomGenerator()
         best_random_solution = None
+        random_solutions = random_gen.run_random(instance, decoder, fitness,
+                                                 K_REPEAT_RANDOM if budget is None else None,
+                                                 cache, WORKERS, budget)
         fitnesses = []
-        for _ in range(K_REPEAT_RANDOM):
-            perm = random_gen.generate(instance)
-            sol = Solution(perm)
-            sol.evaluate(instance, decoder, fitness)
+        for sol in random_solutions:
             fitnesses.append(sol.fitness)
             if best_random_solution is None or sol.fitness < best_random_solution.fitness:
                 best_random_solution = sol
 
-        save_random_results(fitnesses, f"{INSTANCE_SHORT}/ran_result_{decoder.name}_{INSTANCE_SHORT}.csv", best_random_solution.permutation)
+        save_random_results(fitnesses, f"{INSTANCE_SHORT}/ran_result_{decoder.name}_{INSTANCE_SHORT}.csv", best_random_solution.permutation, lower_bound)
         
         print("Random best solution fitness:", best_random_solution.fitness)
         Visualizer.draw_solution(placements=best_random_solution.placements, 
@@ -122,6 +118,17 @@ def main():
                                 best_fitness=best_random_solution.fitness,
                                 metaheuristic_name="Random algorithm",
                                 heuristic_name=decoder.name)
-        
+
+    if cache is not None:
+        print(cache)
+        cache.close()
+
+    if instrumentation.is_enabled():
+        print()
+        print(instrumentation.summary())
+        trace_path = f"{INSTANCE_SHORT}/profile_{METAHEURISTIC}_{decoder.name}_{INSTANCE_SHORT}.json"
+        instrumentation.write_trace(trace_path)
+        print(f"Trace saved to {trace_path}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,151 @@
+from array import array
+from .model.instance import BinPackingInstance
+from .model.compiled import CompiledInstance
+from .model.solution import Solution
+from .heuristics.decoder import Decoder
+from .instrumentation import timed, count
+
+
+# State of a pool worker, set once by _init_worker
+_worker: dict = {}
+
+
+def _init_worker(compiled: CompiledInstance, decoder: Decoder, fitness_evaluator):
+    _worker["instance"] = BinPackingInstance.from_compiled(compiled)
+    _worker["decoder"] = decoder
+    _worker["fitness_evaluator"] = fitness_evaluator
+
+
+def _decode_chunk(permutations: bytes, n_items: int, cutoff: float | None) -> tuple[str, bytes, bytes]:
+    """
+    Decodes a flat buffer of permutations of length n_items.
+    Returns the typecode and bytes of the fitness array and a truncation flag per permutation.
+    """
+    instance = _worker["instance"]
+    decoder = _worker["decoder"]
+    fitness_evaluator = _worker["fitness_evaluator"]
+
+    flat = array("q")
+    flat.frombytes(permutations)
+    fitnesses = []
+    truncated = array("b")
+    for start in range(0, len(flat), n_items):
+        permutation = flat[start:start + n_items].tolist()
+        placements = decoder.decode(instance, permutation, cutoff)
+        fitnesses.append(fitness_evaluator.evaluate(placements))
+        truncated.append(len(placements) < n_items)
+
+    typecode = "q" if all(isinstance(f, int) for f in fitnesses) else "d"
+    return typecode, array(typecode, fitnesses).tobytes(), truncated.tobytes()
+
+
+class BatchEvaluator:
+    """
+    Evaluates many permutations at once.
+    With workers > 1 decoding is spread over a persistent process pool: the
+    compiled instance is sent once per worker, and permutations and fitnesses
+    travel as flat int/float buffers. With workers <= 1 every solution is
+    evaluated in this process with `Solution.evaluate`, exactly as before.
+    """
+
+    def __init__(self, instance: BinPackingInstance, decoder: Decoder, fitness_evaluator,
+                 workers: int = 1, cache=None):
+        self.instance = instance
+        self.decoder = decoder
+        self.fitness_evaluator = fitness_evaluator
+        self.workers = workers
+        self.cache = cache
+        self.pool = None
+        if workers > 1:
+            # Imported here: an evaluator with workers=1 decodes in this process and needs no pool
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(instance.compiled, decoder, fitness_evaluator),
+            )
+
+    def evaluate_many(self, permutations: list[list[int]], cutoff: float | None = None) -> list[float]:
+        """Returns the fitness of every permutation."""
+        solutions = [Solution(perm) for perm in permutations]
+        self.evaluate_solutions(solutions, cutoff=cutoff)
+        return [sol.fitness for sol in solutions]
+
+    @timed("evaluate_batch")
+    def evaluate_solutions(self, solutions: list[Solution], parents: list[Solution] | None = None,
+                           checkpoints: int = 0, cutoff: float | None = None):
+        """
+        Evaluates the solutions in place.
+        A solution that only swaps identical items of its parent gets the parent's
+        fitness without decoding in both paths; checkpoints are used for resumed
+        decoding in the serial path only (decoder states are not sent between processes).
+        """
+        if self.pool is None:
+            for k, sol in enumerate(solutions):
+                sol.evaluate(self.instance, self.decoder, self.fitness_evaluator,
+                             parent=parents[k] if parents is not None else None,
+                             checkpoints=checkpoints, cache=self.cache, cutoff=cutoff)
+            return
+
+        # Permutations with the same type sequence (identical items swapped) are decoded once
+        compiled = self.instance.compiled
+        pending: dict[tuple[int, ...], list[Solution]] = {}
+        for k, sol in enumerate(solutions):
+            parent = parents[k] if parents is not None else None
+            if parent is not None and sol.same_packing_as(parent, self.instance, self.decoder, cutoff):
+                count("evaluate/identical_items")
+                sol.assign(self.instance, self.decoder, parent.fitness)
+                continue
+            if self.cache is not None:
+                fitness = self.cache.get(self.cache.key(self.decoder.name, sol.permutation, compiled))
+                if fitness is not None:
+                    sol.assign(self.instance, self.decoder, fitness,
+                               cutoff if cutoff is not None and fitness > cutoff else None)
+                    continue
+            pending.setdefault(tuple(compiled.type_sequence(sol.permutation)), []).append(sol)
+
+        groups = list(pending.values())
+        permutations = [tuple(group[0].permutation) for group in groups]
+        results = self._decode_remote(permutations, cutoff)
+        for perm, group, (fitness, truncated) in zip(permutations, groups, results):
+            above = truncated or (cutoff is not None and fitness > cutoff)
+            for sol in group:
+                sol.assign(self.instance, self.decoder, fitness, cutoff if above else None)
+            if self.cache is not None and not truncated:
+                self.cache.put(self.cache.key(self.decoder.name, perm, compiled), fitness)
+
+    def _decode_remote(self, permutations: list[tuple[int, ...]], cutoff: float | None) -> list[tuple[float, bool]]:
+        if not permutations:
+            return []
+        n_items = len(permutations[0])
+        n_chunks = min(len(permutations), self.workers * 4)
+        size = -(-len(permutations) // n_chunks)
+
+        futures = []
+        for start in range(0, len(permutations), size):
+            flat = array("q")
+            for perm in permutations[start:start + size]:
+                flat.extend(perm)
+            futures.append(self.pool.submit(_decode_chunk, flat.tobytes(), n_items, cutoff))
+
+        results = []
+        for future in futures:
+            typecode, fitness_bytes, truncated_bytes = future.result()
+            fitnesses = array(typecode)
+            fitnesses.frombytes(fitness_bytes)
+            truncated = array("b")
+            truncated.frombytes(truncated_bytes)
+            results.extend(zip(fitnesses.tolist(), (bool(t) for t in truncated)))
+        return results
+
+    def close(self):
+        """Shuts the worker pool down."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,54 @@
+import argparse
+import sys
+from .runner import run_cases, save_results, load_results, compare, failed_cases
+from .suite import build_cases
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__package__}",
+        description="Times decoders, GA operators and full GA/SA runs on the BENG instances, "
+                    "and imports of the solver modules.")
+    parser.add_argument("--instances", nargs="*", help="instance names, e.g. BENG01 BENG06 (default: all)")
+    parser.add_argument("--groups", nargs="*", choices=["decode", "operators", "solve", "imports"],
+                        help="benchmark groups (default: all)")
+    parser.add_argument("--filter", default="", help="only cases whose name contains this text")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds measured per case")
+    parser.add_argument("--min-ops", type=int, default=5, help="calls measured per case")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative change reported as a regression (default 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in build_cases(args.instances, args.groups, args.seed) if args.filter in case[0]]
+    results = run_cases(cases, args.min_time, args.min_ops)
+    save_results(results, args.output, {
+        "instances": args.instances, "groups": args.groups, "seed": args.seed,
+        "min_time": args.min_time, "min_ops": args.min_ops,
+    })
+    print(f"Results saved to {args.output}")
+
+    status = 0
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            status = 1
+        else:
+            print(f"\nNo regressions beyond {args.threshold:.0%}.")
+
+    failed = failed_cases(results)
+    if failed:
+        print(f"\n{len(failed)} failed case(s):")
+        for name in failed:
+            print(f"  {name}: {results[name]['error']}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
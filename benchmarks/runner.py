@@ -0,0 +1,112 @@
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Returns the q-th percentile (0..100) of sorted values, with linear interpolation."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def measure(operation, min_time: float = 0.5, min_ops: int = 5, warmup: int = 1) -> dict:
+    """
+    Calls operation() repeatedly (after warmup calls) until both min_time
+    seconds and min_ops calls have passed, then once more under tracemalloc.
+    Returns operations per second, p50/p95 latency in milliseconds and the
+    peak traced memory of a single call in KiB.
+    """
+    for _ in range(warmup):
+        operation()
+
+    latencies = []
+    start = time.perf_counter()
+    while len(latencies) < min_ops or time.perf_counter() - start < min_time:
+        t = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - t)
+    total = sum(latencies)
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops": len(latencies),
+        "ops_per_sec": round(len(latencies) / total, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_cases(cases: list[tuple[str, str, object]], min_time: float = 0.5, min_ops: int = 5, log=print) -> dict:
+    """
+    Measures every (name, unit, operation) case; returns the results keyed by name.
+    A case whose operation raises is recorded as {"unit", "error"} and the other cases still run.
+    """
+    results = {}
+    for name, unit, operation in cases:
+        try:
+            result = measure(operation, min_time, min_ops)
+        except Exception as error:
+            results[name] = {"unit": unit, "error": str(error)}
+            log(f"{name:<45} FAILED: {error}")
+            continue
+        result["unit"] = unit
+        results[name] = result
+        log(f"{name:<45} {result['ops_per_sec']:>12.2f} {unit}/s  "
+            f"p50 {result['p50_ms']:>10.3f} ms  p95 {result['p95_ms']:>10.3f} ms  "
+            f"peak {result['peak_kib']:>9.1f} KiB")
+    return results
+
+
+def save_results(results: dict, path: str, settings: dict):
+    """Writes the results with the environment and benchmark settings to a JSON file."""
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def failed_cases(results: dict) -> list[str]:
+    """Names of the cases that raised instead of being measured."""
+    return [name for name, result in results.items() if "error" in result]
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.1) -> list[str]:
+    """
+    Compares results with a baseline and returns the regressions: cases whose
+    throughput dropped, or whose p95 latency or peak memory grew, by more
+    than threshold (a fraction). Cases missing or failed on either side are skipped.
+    """
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None or "error" in before or "error" in current:
+            continue
+        if current["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{name}: {current['unit']}/s {before['ops_per_sec']} -> {current['ops_per_sec']}")
+        if current["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {before['p95_ms']} ms -> {current['p95_ms']} ms")
+        if current["peak_kib"] > before["peak_kib"] * (1 + threshold):
+            regressions.append(f"{name}: peak {before['peak_kib']} KiB -> {current['peak_kib']} KiB")
+    return regressions
@@ -0,0 +1,91 @@
+import argparse
+import json
+import random
+import sys
+import time
+from .runner import measure
+from ..data.generator import generate_guillotine_instance
+from ..utils import get_decoder
+
+DEFAULT_SIZES = [100, 300, 1000, 3000, 10000, 30000, 100000]
+
+
+def scaling_results(sizes: list[int], decoders: list[int], seed: int = 0, time_limit: float = 10.0,
+                    min_time: float = 0.5, min_ops: int = 1, log=print) -> dict:
+    """
+    Decodes a random permutation of generated guillotine instances of every size
+    with every decoder and returns {decoder name: [{"n", "optimum", "height", ...measure()}]}.
+    The first decode of every case is timed on its own; if it takes more than
+    time_limit seconds, only that decode is reported (no memory measurement)
+    and the decoder is dropped from larger sizes.
+    """
+    results = {}
+    active = list(decoders)
+    for n in sorted(sizes):
+        instance, optimum = generate_guillotine_instance(n, seed=seed)
+        permutation = [item.id for item in instance.items]
+        random.Random(seed).shuffle(permutation)
+        for choice in list(active):
+            decoder = get_decoder(choice)
+            name = type(decoder).__name__
+            start = time.perf_counter()
+            height = max(p.y + p.height for p in decoder.decode(instance, permutation))
+            first = time.perf_counter() - start
+            if first > time_limit:
+                # Too slow to repeat: report the single decode and skip larger sizes
+                ms = round(first * 1000, 4)
+                result = {"ops": 1, "ops_per_sec": round(1 / first, 3), "p50_ms": ms, "p95_ms": ms, "peak_kib": None}
+                active.remove(choice)
+            else:
+                # The first decode served as warmup
+                result = measure(lambda: decoder.decode(instance, permutation), min_time, min_ops, warmup=0)
+            result.update(n=n, optimum=optimum, height=height)
+            results.setdefault(name, []).append(result)
+            peak = "-" if result["peak_kib"] is None else f"{result['peak_kib']:.1f}"
+            log(f"{name:<20} n={n:<8} {result['p50_ms']:>12.2f} ms  peak {peak:>10} KiB  "
+                f"height {height} (optimum {optimum})")
+    return results
+
+
+def plot_scaling(results: dict, path: str):
+    """Log-log plots of the decode time and peak memory against the number of items."""
+    import matplotlib.pyplot as plt
+    fig, (time_ax, memory_ax) = plt.subplots(1, 2, figsize=(12, 5))
+    for name, rows in results.items():
+        time_ax.plot([row["n"] for row in rows], [row["p50_ms"] for row in rows], marker="o", label=name)
+        measured = [row for row in rows if row["peak_kib"] is not None]
+        memory_ax.plot([row["n"] for row in measured], [row["peak_kib"] for row in measured], marker="o", label=name)
+    for ax, label in ((time_ax, "Decode time p50 [ms]"), (memory_ax, "Peak memory [KiB]")):
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Items")
+        ax.set_ylabel(label)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__spec__.name}",
+        description="Decode time and memory of every decoder on generated guillotine instances of growing size.")
+    parser.add_argument("--sizes", nargs="*", type=int, default=DEFAULT_SIZES, help="numbers of items")
+    parser.add_argument("--decoders", nargs="*", type=int, default=[1, 2, 3, 4, 5], help="choices of get_decoder")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=10.0,
+                        help="skip larger sizes for a decoder once one decode takes longer (seconds)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds measured per case")
+    parser.add_argument("--output", default="scaling_results", help="prefix of the .json and .png outputs")
+    args = parser.parse_args(argv)
+
+    results = scaling_results(args.sizes, args.decoders, args.seed, args.time_limit, args.min_time)
+    with open(f"{args.output}.json", "w") as f:
+        json.dump({"settings": vars(args), "results": results}, f, indent=2)
+    plot_scaling(results, f"{args.output}.png")
+    print(f"Results saved to {args.output}.json and {args.output}.png")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import random
+import subprocess
+import sys
+from itertools import cycle
+from pathlib import Path
+import numpy as np
+from ..data.loader import load_beng_instance
+from ..model.solution import Solution
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.ga import GeneticAlgorithm
+from ..metaheuristics.ga.genetic_operators import ordered_crossover, inversion_mutation
+from ..metaheuristics.ga.batch_operators import ordered_crossover_batch, inversion_mutation_batch
+from ..metaheuristics.sa import SimulatedAnnealing
+from ..utils import get_decoder
+
+BENG_DIR = Path(__file__).resolve().parent.parent / "data" / "BENG"
+
+# Decoder choices of get_decoder
+DECODERS = [1, 2, 3, 4, 5]
+
+# Small but complete runs, so a whole suite finishes in minutes
+GA_PARAMETERS = {
+    "population_size": 20,
+    "generations": 20,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 5,
+}
+SA_PARAMETERS = {
+    "T0": 20,
+    "T_min": 1,
+    "alpha": 0.8,
+    "max_iter": 30,
+}
+
+# Solver modules timed by the "imports" group; none of them may load LAZY_MODULES
+CORE_MODULES = ["fitness", "model.solution", "heuristics.bottom_left_indexed", "heuristics.skyline",
+                "metaheuristics.sa", "metaheuristics.ga.ga", "__main__"]
+LAZY_MODULES = ("matplotlib", "numpy")
+
+
+def instance_paths(names: list[str] | None = None) -> list[Path]:
+    """Returns the BENG instance files, all of them or the given names (e.g. BENG01)."""
+    paths = sorted(BENG_DIR.glob("*.ins2D"))
+    if names:
+        paths = [p for p in paths if p.stem in names]
+    return paths
+
+
+def decode_cases(instance, short: str, seed: int, n_permutations: int = 20):
+    """One case per decoder: decoding fixed random permutations in turn (unit: decode)."""
+    rng = random.Random(seed)
+    item_ids = [item.id for item in instance.items]
+    permutations = [rng.sample(item_ids, len(item_ids)) for _ in range(n_permutations)]
+    cases = []
+    for choice in DECODERS:
+        decoder = get_decoder(choice)
+        next_permutation = cycle(permutations).__next__
+        cases.append((f"decode/{type(decoder).__name__}/{short}", "decode",
+                      lambda decoder=decoder, next_permutation=next_permutation:
+                      decoder.decode(instance, next_permutation())))
+    return cases
+
+
+def operator_cases(instance, short: str, seed: int):
+    """GA operators and Solution.copy on permutations of the instance (unit: op)."""
+    rng = random.Random(seed)
+    item_ids = [item.id for item in instance.items]
+    parent1 = rng.sample(item_ids, len(item_ids))
+    parent2 = rng.sample(item_ids, len(item_ids))
+    solution = Solution(parent1)
+    solution.evaluate(instance, get_decoder(3), HeightFitnessEvaluator())
+
+    np_rng = np.random.default_rng(seed)
+    population = np.array([np_rng.permutation(len(item_ids)) for _ in range(GA_PARAMETERS["population_size"])])
+
+    def crossover():
+        random.seed(seed)
+        ordered_crossover(parent1, parent2)
+
+    def mutation():
+        random.seed(seed)
+        inversion_mutation(parent1, 1.0)
+
+    def crossover_batch():
+        ordered_crossover_batch(population, population[::-1], np.random.default_rng(seed))
+
+    def mutation_batch():
+        inversion_mutation_batch(population, 1.0, np.random.default_rng(seed))
+
+    return [
+        (f"ordered_crossover/{short}", "op", crossover),
+        (f"inversion_mutation/{short}", "op", mutation),
+        (f"ordered_crossover_batch/{short}", "generation", crossover_batch),
+        (f"inversion_mutation_batch/{short}", "generation", mutation_batch),
+        (f"solution_copy/{short}", "op", solution.copy),
+    ]
+
+
+def solve_cases(instance, short: str, seed: int):
+    """End-to-end GA and SA runs with the indexed BL decoder under a fixed seed (unit: run)."""
+    decoder = get_decoder(3)
+    fitness = HeightFitnessEvaluator()
+    item_ids = [item.id for item in instance.items]
+    return [
+        (f"solve/GA/{short}", "run",
+         lambda: GeneticAlgorithm.single_run(seed, None, instance, decoder, fitness, item_ids, GA_PARAMETERS)),
+        (f"solve/SA/{short}", "run",
+         lambda: SimulatedAnnealing.single_run(seed, None, instance, decoder, fitness, item_ids, SA_PARAMETERS)),
+    ]
+
+
+def import_cases():
+    """
+    Imports of the solver modules in a fresh interpreter (unit: import), next to an
+    empty interpreter start ("import/python") for reference. A case fails (is reported
+    as failed by run_cases) if the module loads matplotlib or numpy, which only
+    plotting and the vectorized GA need.
+    """
+    package = __package__.rpartition(".")[0]
+    root = BENG_DIR.parents[2]
+
+    def run(code: str):
+        return subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                              check=True).stdout.strip()
+
+    cases = [("import/python", "import", lambda: run("pass"))]
+    for module in CORE_MODULES:
+        name = f"{package}.{module}"
+        code = f"import sys, {name}; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+
+        def operation(code=code, name=name):
+            loaded = run(code)
+            if loaded:
+                raise RuntimeError(f"importing {name} loads {loaded}")
+
+        cases.append((f"import/{module}", "import", operation))
+    return cases
+
+
+def build_cases(names: list[str] | None = None, groups: list[str] | None = None, seed: int = 0):
+    """
+    Returns (name, unit, operation) cases for the given instances and groups
+    ("decode", "operators", "solve", "imports"; all by default).
+    """
+    groups = groups or ["decode", "operators", "solve", "imports"]
+    cases = import_cases() if "imports" in groups else []
+    for path in instance_paths(names):
+        instance = load_beng_instance(path)
+        short = path.stem
+        if "decode" in groups:
+            cases += decode_cases(instance, short, seed)
+        if "operators" in groups:
+            cases += operator_cases(instance, short, seed)
+        if "solve" in groups:
+            cases += solve_cases(instance, short, seed)
+    return cases
@@ -0,0 +1,66 @@
+import time
+
+
+class Budget:
+    """
+    Compute budget of one run: a maximum wall time (seconds) and/or a maximum
+    number of evaluations (every evaluated permutation counts, cache hits too,
+    so algorithms are compared by the same number of solutions examined).
+    A run calls `start`, `charge`s its evaluations and stops once `exhausted`.
+    None limits are not enforced.
+    """
+
+    def __init__(self, max_time: float | None = None, max_evaluations: int | None = None):
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError(f"max_evaluations must be at least 1, got {max_evaluations}")
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.start_time = time.perf_counter()
+        self.evaluations = 0
+
+    def start(self) -> "Budget":
+        """Resets the clock and the evaluation counter; returns self."""
+        self.start_time = time.perf_counter()
+        self.evaluations = 0
+        return self
+
+    def charge(self, evaluations: int = 1):
+        self.evaluations += evaluations
+
+    def state(self) -> tuple[float, int]:
+        """Elapsed time and evaluations, to be saved with a checkpoint."""
+        return self.elapsed(), self.evaluations
+
+    def restore(self, state: tuple[float, int]):
+        """Continues from a saved state, as if the run had not been interrupted."""
+        elapsed, self.evaluations = state
+        self.start_time = time.perf_counter() - elapsed
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def used(self) -> float:
+        """Returns the used part of the budget in [0, 1] (the larger of time and evaluations)."""
+        fractions = [0.0]
+        if self.max_time is not None:
+            fractions.append(self.elapsed() / self.max_time)
+        if self.max_evaluations is not None:
+            fractions.append(self.evaluations / self.max_evaluations)
+        return min(max(fractions), 1.0)
+
+    def remaining_evaluations(self) -> int | None:
+        """Returns the number of evaluations left, or None without an evaluation limit."""
+        if self.max_evaluations is None:
+            return None
+        return max(self.max_evaluations - self.evaluations, 0)
+
+    def exhausted(self) -> bool:
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return True
+        return self.max_time is not None and self.elapsed() >= self.max_time
+
+    def __repr__(self) -> str:
+        return (
+            f"Budget(max_time={self.max_time}, max_evaluations={self.max_evaluations}, "
+            f"elapsed={self.elapsed():.2f}, evaluations={self.evaluations})"
+        )
@@ -0,0 +1,75 @@
+import os
+import pickle
+from pathlib import Path
+
+# Parameters that may differ between a run and its resumption
+RESUME_PARAMETERS = ("resume", "checkpoint_every")
+
+
+def checkpoint_path(directory: str, method: str, decoder_name: str, seed: int) -> Path:
+    """Checkpoint file of one run; the run seed identifies the run for a given master seed."""
+    return Path(directory) / f"{method}_{decoder_name}_{seed}.pkl"
+
+
+def master_seed_path(directory: str, method: str, decoder_name: str) -> Path:
+    """File keeping the master seed of the checkpointed runs of a method and decoder."""
+    return Path(directory) / f"{method}_{decoder_name}_master_seed.txt"
+
+
+def checkpoint_master_seed(directory: str, method: str, decoder_name: str, seed: int | None,
+                           resume: bool) -> int:
+    """
+    Returns the master seed of checkpointed runs and saves it in directory.
+    With resume and no seed given, the seed saved by the interrupted runs is reused,
+    so their checkpoints are found; without a saved seed a new one is drawn.
+    Raises ValueError if checkpoints exist but no saved seed identifies them.
+    """
+    from .multi_run import new_master_seed
+    path = master_seed_path(directory, method, decoder_name)
+    if seed is None and resume:
+        if path.exists():
+            seed = int(path.read_text())
+        elif any(Path(directory).glob(f"{method}_{decoder_name}_*.pkl")):
+            raise ValueError(f"Checkpoints in {directory} have no saved master seed: set the seed to resume them")
+    if seed is None:
+        seed = new_master_seed()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(str(seed))
+    os.replace(tmp_path, path)
+    return seed
+
+
+def run_parameters(parameters: dict) -> dict:
+    """Parameters stored with a checkpoint and compared on resume."""
+    return {k: v for k, v in parameters.items() if k not in RESUME_PARAMETERS}
+
+
+def save_checkpoint(state: dict, path: str | Path):
+    """
+    Pickles the state of a run atomically: it is written to a temporary file
+    that then replaces the previous checkpoint, so a crash during the write
+    leaves the previous checkpoint intact.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str | Path, parameters: dict | None = None) -> dict | None:
+    """
+    Returns the state saved in path, or None if there is no checkpoint.
+    With parameters, raises ValueError if the checkpoint was saved by a run
+    with other parameters (apart from RESUME_PARAMETERS).
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if parameters is not None and state["parameters"] != run_parameters(parameters):
+        raise ValueError(f"Checkpoint {path} was saved with different parameters")
+    return state
@@ -0,0 +1,57 @@
+# CONFIGURATION of __main__.py; the GA/SA parameters and constants are also the defaults of experiments.py
+
+INSTANCE_NAME = "BENG06.ins2D"
+INSTANCE_SHORT = INSTANCE_NAME.split('.')[0].lower()
+DECODER_TYPE = 1   # "1 = BL", "2 = BLF", "3 = BL (indexed)", "4 = SKY" or "5 = HMAP"
+METAHEURISTIC = "GA" # "SA" or "GA"
+K_REPEAT_RANDOM = 1000   # ignored when a budget is set
+N_RUNS = 10
+CACHE_SIZE = 100_000    # evaluations kept in memory (0 = no cache)
+CACHE_PERSIST = False   # also store evaluations in <instance>/evaluations_<decoder>.sqlite
+WORKERS = 1             # processes used for batch evaluation (GA generations, random baseline)
+RUN_WORKERS = 1         # processes executing whole GA/SA runs in parallel
+SEED = None             # master seed of the GA/SA runs (None = random, printed in the log)
+MAX_TIME = None         # budget of every GA/SA run and of the random baseline: seconds ...
+MAX_EVALUATIONS = None  # ... and/or evaluated permutations (None = no limit)
+PROFILE = False         # time decoding, operators and output; also enabled by PACKING_PROFILE=1
+
+RUN_METHODS = {
+    "SA": 0,
+    "GA": 1,
+    "GREEDY": 0,
+    "RANDOM": 0,
+}
+
+ga_parameters = {
+      "population_size": 80,
+      "generations": 300,
+      "mutation_rate": 0.1,
+      "crossover_size": 0.7,
+      "tournament_size": 5,
+      "checkpoints": 0,
+      "cutoff": None,     # None, "best" or "worst": stop decoding children above this height
+      "vectorized": False,  # batched numpy selection/crossover/mutation
+      "stop_at_bound": True,  # stop a run once it reaches the lower bound of the instance
+      "islands": 1,       # > 1: island model, one population of population_size per process
+      "migration_interval": 10,
+      "migrants": 2,
+      "topology": "ring", # "ring" or "complete"
+      "checkpoint_every": 0,  # > 0: save every run to <instance>/checkpoints every this many generations
+      "resume": False,    # continue every run from its checkpoint (SEED = None reuses the saved master seed)
+} 
+
+sa_parameters = {
+      "T0": 50,
+      "T_min": 0.1,
+      "alpha": 0.95,
+      "max_iter": 100,
+      "schedule": "geometric", # "geometric" (alpha every max_iter) or "budget" (T0 -> T_min over the budget)
+      "checkpoints": 8,
+      "early_cutoff": False,   # stop decoding candidates that will be rejected anyway
+      "stop_at_bound": True,   # stop a run once it reaches the lower bound of the instance
+      "replicas": 1,           # > 1: parallel tempering, one chain per process at fixed T from T_min to T0
+      "exchange_interval": 100,
+      "exchanges": 50,
+      "checkpoint_every": 0,   # > 0: save every run to <instance>/checkpoints every this many temperature steps
+      "resume": False,         # continue every run from its checkpoint (SEED = None reuses the saved master seed)
+}
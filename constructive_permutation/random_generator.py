@@ -1,7 +1,9 @@
+
 from ..constructive_permutation.permutation_generator import PermutationGenerator
 from ..model.solution import Solution
+from ..batch_evaluator import BatchEvaluator
 import random
-            
+
 class RandomGenerator(PermutationGenerator):
 
     def generate(self, instance):
@@ -9,4 +11,31 @@ class RandomGenerator(PermutationGenerator):
         random.shuffle(item_ids)
         return item_ids
 
-    
\ No newline at end of file
+    def run_random(self, instance, decoder, fitness, n: int | None, cache=None, workers: int = 1,
+                   budget=None, batch_size: int = 100) -> list[Solution]:
+        """
+        Random baseline: evaluates up to n random permutations in batches of
+        batch_size, stopping earlier once the budget is exhausted (n may be
+        None only with a budget). Returns the evaluated solutions.
+        """
+        if n is None and budget is None:
+            raise ValueError("n can be None only with a budget")
+        if budget is not None:
+            budget.start()
+
+        solutions = []
+        with BatchEvaluator(instance, decoder, fitness, workers=workers, cache=cache) as evaluator:
+            while n is None or len(solutions) < n:
+                size = batch_size if n is None else min(batch_size, n - len(solutions))
+                if budget is not None:
+                    if budget.exhausted():
+                        break
+                    remaining = budget.remaining_evaluations()
+                    if remaining is not None:
+                        size = min(size, remaining)
+                batch = [Solution(self.generate(instance)) for _ in range(size)]
+                evaluator.evaluate_solutions(batch)
+                if budget is not None:
+                    budget.charge(len(batch))
+                solutions.extend(batch)
+        return solutions
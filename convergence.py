@@ -0,0 +1,64 @@
+from time import perf_counter
+
+
+class ConvergenceTrace:
+    """
+    Improvement events of one run: (seconds since the start, evaluations, best fitness),
+    recorded whenever the best fitness improves. Evaluations are counted with `charge`.
+    """
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.evaluations = 0
+        self.events: list[tuple[float, int, float]] = []
+
+    def charge(self, evaluations: int = 1):
+        self.evaluations += evaluations
+
+    def improve(self, fitness: float, evaluations: int | None = None):
+        """
+        Records fitness if it is better than the last recorded one.
+        evaluations: number of evaluations at which it was found (default: all charged so far).
+        """
+        if self.events and fitness >= self.events[-1][2]:
+            return
+        if evaluations is None:
+            evaluations = self.evaluations
+        self.events.append((perf_counter() - self.start, evaluations, fitness))
+
+    def state(self) -> tuple[float, int, list]:
+        """Elapsed time, evaluations and events, to be saved with a checkpoint."""
+        return perf_counter() - self.start, self.evaluations, list(self.events)
+
+    def restore(self, state: tuple[float, int, list]):
+        """Continues from a saved state; times keep counting from the saved elapsed time."""
+        elapsed, self.evaluations, events = state
+        self.events = list(events)
+        self.start = perf_counter() - elapsed
+
+    def __len__(self):
+        return len(self.events)
+
+
+def time_to_target(events: list[tuple[float, int, float]], target: float) -> tuple[float, int] | None:
+    """Returns the (time, evaluations) of the first event reaching the target, or None."""
+    for time, evaluations, fitness in events:
+        if fitness <= target:
+            return time, evaluations
+    return None
+
+
+def anytime_curve(events: list[tuple[float, int, float]], grid: list[float], axis: int = 0) -> list[float | None]:
+    """
+    Returns the best fitness reached at every point of the grid, measured in time
+    (axis=0) or in evaluations (axis=1); None before the first event.
+    """
+    curve = []
+    k = 0
+    best = None
+    for point in grid:
+        while k < len(events) and events[k][axis] <= point:
+            best = events[k][2]
+            k += 1
+        curve.append(best)
+    return curve
@@ -0,0 +1,99 @@
+import heapq
+import math
+import random
+from ..model.instance import BinPackingInstance
+from ..model.item import Item
+
+SIZE_MODES = ("uniform", "mixed")
+
+
+def _margin(side: int, other: int, max_aspect: float) -> int | None:
+    """Smallest piece length when cutting side that keeps both pieces within max_aspect, or None."""
+    margin = max(1, math.ceil(other / max_aspect))
+    return margin if 2 * margin <= side else None
+
+
+def guillotine_rectangles(n: int, width: int, height: int, max_aspect: float = 4.0,
+                          sizes: str = "uniform", seed: int = 0) -> list[tuple[int, int]]:
+    """
+    Cuts a width x height rectangle into n integer rectangles by guillotine cuts.
+    sizes="uniform" always cuts the largest piece (similar areas), "mixed" cuts a
+    random piece (many small and a few large ones). The cut direction is random
+    among those that keep both pieces within max_aspect, and the cut position
+    uniform over such positions; pieces too small for that (only with many
+    items on a small strip) are cut anywhere across their longer side.
+    """
+    if sizes not in SIZE_MODES:
+        raise ValueError(f"sizes must be one of {SIZE_MODES}")
+    if n > width * height:
+        raise ValueError("n is larger than the number of unit squares of the strip")
+    rng = random.Random(seed)
+
+    pieces = [(-width * height, 0, width, height)]    # heap of (-area, tie-break, w, h)
+    counter = 1
+    while len(pieces) < n:
+        if sizes == "uniform":
+            _, _, w, h = heapq.heappop(pieces)
+        else:
+            k = rng.randrange(len(pieces))
+            _, _, w, h = pieces[k]
+            pieces[k] = pieces[-1]
+            pieces.pop()
+            while w == 1 and h == 1:   # cannot be cut, put it back and draw again
+                pieces.append((-1, counter, 1, 1))
+                counter += 1
+                k = rng.randrange(len(pieces))
+                _, _, w, h = pieces[k]
+                pieces[k] = pieces[-1]
+                pieces.pop()
+
+        width_margin = _margin(w, h, max_aspect)
+        height_margin = _margin(h, w, max_aspect)
+        if width_margin is None and height_margin is None:
+            # Too small to keep the aspect ratio: cut the longer side anywhere
+            cut_width = w >= h
+            width_margin = height_margin = 1
+        elif width_margin is None or height_margin is None:
+            cut_width = width_margin is not None
+        else:
+            cut_width = rng.random() < 0.5
+
+        if cut_width:
+            cut = rng.randint(width_margin, w - width_margin)
+            new_pieces = [(cut, h), (w - cut, h)]
+        else:
+            cut = rng.randint(height_margin, h - height_margin)
+            new_pieces = [(w, cut), (w, h - cut)]
+
+        for pw, ph in new_pieces:
+            entry = (-pw * ph, counter, pw, ph)
+            counter += 1
+            if sizes == "uniform":
+                heapq.heappush(pieces, entry)
+            else:
+                pieces.append(entry)
+
+    rectangles = [(w, h) for _, _, w, h in pieces]
+    rng.shuffle(rectangles)
+    return rectangles
+
+
+def generate_guillotine_instance(n: int, width: int = 1000, height: int | None = None, max_aspect: float = 4.0,
+                                 sizes: str = "uniform", seed: int = 0) -> tuple[BinPackingInstance, int]:
+    """
+    Returns a strip packing instance of n items with a known optimal height and
+    that height. The items tile a width x height strip (default height = width),
+    so the optimum equals the area bound (`instance.area_bound()`).
+    """
+    height = width if height is None else height
+    rectangles = guillotine_rectangles(n, width, height, max_aspect, sizes, seed)
+    items = [Item(item_id, w, h) for item_id, (w, h) in enumerate(rectangles, start=1)]
+    return BinPackingInstance(width, -1, items), height
+
+
+def write_instance(instance: BinPackingInstance, file_path: str):
+    """Writes an instance in the 2DPackLib format read by `data.loader`."""
+    with open(file_path, "w") as f:
+        f.write(f"{instance.num_items}\n{instance.bin_width} {instance.bin_height}\n")
+        for item in instance.items:
+            f.write(f"{item.id} {item.width} {item.height} {item.demand} {item.max_copies} {item.profit}\n")
@@ -1,8 +1,67 @@
+import os
+from hashlib import blake2b
+from pathlib import Path
 from ..model.instance import BinPackingInstance
 from ..model.item import Item
 
+INSTANCE_PATTERN = "*.ins2D"
+# Cache directory created inside a dataset directory by load_dataset
+CACHE_DIR_NAME = ".instance_cache"
+# Hashed with the file contents; bump it when parse_instance_array changes, so old arrays are not reused
+CACHE_VERSION = b"2"
+# numpy is only imported by the dataset functions, so loading a single instance does not need it
+
+
+def parse_instance_array(file_path: str) -> "np.ndarray":
+    """
+    Parses a 2DPackLib instance (m / W H / i w h d b p lines) into one int64 array
+    of shape (m + 1, 6): row 0 holds (m, W, H, 0, 0, 0), row k + 1 the item k.
+    Like `load_beng_instance`, only the first 6 fields of an item line are read.
+    """
+    import numpy as np
+    with open(file_path, "r") as f:
+        lines = [line.split() for line in f if line.strip()]
+    m = int(lines[0][0])
+    bin_width, bin_height = map(int, lines[1][:2])
+    if len(lines) < 2 + m or any(len(fields) < 6 for fields in lines[2:2 + m]):
+        raise ValueError(f"{file_path}: expected {m} item lines of at least 6 fields")
+    data = np.zeros((m + 1, 6), dtype=np.int64)
+    data[0, :3] = [m, bin_width, bin_height]
+    data[1:] = np.array([fields[:6] for fields in lines[2:2 + m]], dtype=np.int64)
+    return data
+
+
+def expand_demand(items: list[Item]) -> list[Item]:
+    """
+    Replaces every item of demand d > 1 by d items of demand 1: the item itself
+    and d - 1 copies appended at the end with new ids (after the largest id).
+    Items of demand 0 are left out, as no copy of them has to be packed.
+    Identical copies form one item type of the compiled instance.
+    """
+    if all(item.demand == 1 for item in items):
+        return items
+    next_id = max(item.id for item in items) + 1
+    expanded = []
+    copies = []
+    for item in items:
+        if item.demand < 1:
+            continue
+        expanded.append(Item(item.id, item.width, item.height, 1, item.max_copies, item.profit))
+        for _ in range(item.demand - 1):
+            copies.append(Item(next_id, item.width, item.height, 1, item.max_copies, item.profit))
+            next_id += 1
+    return expanded + copies
+
+
+def instance_from_array(data: "np.ndarray") -> BinPackingInstance:
+    """Builds an instance from the array of `parse_instance_array` (or its cached copy), with demands expanded."""
+    _, bin_width, bin_height = data[0, :3].tolist()
+    items = [Item(item_id, w, h, d, b, p) for item_id, w, h, d, b, p in data[1:].tolist()]
+    return BinPackingInstance(bin_width, bin_height, expand_demand(items))
+
+
 def load_beng_instance(file_path: str) -> BinPackingInstance:
-    """Load a BENG instance from the 2DPackLib dataset"""    
+    """Load a BENG instance from the 2DPackLib dataset"""
     items = []
     with open(file_path, "r") as f:
         lines = [line.strip() for line in f if line.strip()]
@@ -11,15 +70,66 @@ def load_beng_instance(file_path: str) -> BinPackingInstance:
     bin_width, bin_height = map(int, lines[1].split())
 
     for line in lines[2:2 + m]:
-        parts = line.split()
-        item_id = int(parts[0])
-        w = int(parts[1])
-        h = int(parts[2])
-        d = int(parts[3])
-        b = int(parts[4])
-        p = int(parts[5])
+        item_id, w, h, d, b, p = map(int, line.split()[:6])
         items.append(Item(item_id, w, h, d, b, p))
 
-    return BinPackingInstance(bin_width, bin_height, items)
+    return BinPackingInstance(bin_width, bin_height, expand_demand(items))
+
+
+def cache_path(file_path: str, cache_dir: str) -> Path:
+    """Cache file of an instance: <cache_dir>/<name>-<hash of the file contents and CACHE_VERSION>.npy"""
+    with open(file_path, "rb") as f:
+        digest = blake2b(f.read() + CACHE_VERSION, digest_size=16).hexdigest()
+    return Path(cache_dir) / f"{Path(file_path).stem}-{digest}.npy"
+
+
+def _save_array(data: "np.ndarray", path: Path):
+    """Writes the cache file atomically, so an interrupted write never leaves a broken entry."""
+    import numpy as np
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, data)
+    os.replace(tmp_path, path)
+
+
+def load_dataset_arrays(directory: str, pattern: str = INSTANCE_PATTERN, cache_dir: str | None = None,
+                        workers: int = 1) -> "dict[str, np.ndarray]":
+    """
+    Returns {instance name: array of `parse_instance_array`} for every file matching
+    pattern in directory (BENG or any other 2DPackLib family), sorted by name.
+    Parsed instances are stored in cache_dir (default <directory>/.instance_cache)
+    under the hash of the file contents, so an edited file is parsed again.
+    Cached arrays are memory-mapped read-only; files not yet cached are parsed
+    in a process pool when workers > 1.
+    """
+    import numpy as np
+    cache_dir = Path(cache_dir) if cache_dir is not None else Path(directory) / CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    arrays = {}
+    missing = []
+    for path in sorted(Path(directory).glob(pattern)):
+        cached = cache_path(path, cache_dir)
+        if cached.exists():
+            arrays[path.stem] = np.load(cached, mmap_mode="r")
+        else:
+            missing.append((path, cached))
+
+    if workers > 1 and len(missing) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_instance_array, [path for path, _ in missing]))
+    else:
+        parsed = [parse_instance_array(path) for path, _ in missing]
+
+    for (path, cached), data in zip(missing, parsed):
+        _save_array(data, cached)
+        arrays[path.stem] = data
+    return dict(sorted(arrays.items()))
 
 
+def load_dataset(directory: str, pattern: str = INSTANCE_PATTERN, cache_dir: str | None = None,
+                 workers: int = 1) -> dict[str, BinPackingInstance]:
+    """Loads every instance of a dataset directory, {name: instance}, through the binary cache."""
+    arrays = load_dataset_arrays(directory, pattern, cache_dir, workers)
+    return {name: instance_from_array(data) for name, data in arrays.items()}
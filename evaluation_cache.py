@@ -0,0 +1,100 @@
+import sqlite3
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+
+
+class EvaluationCache:
+    """
+    Fitness cache keyed by a hash of the permutation and the decoder name.
+    Keeps up to max_size entries in memory with LRU eviction. If a path is
+    given, every evaluation is also stored in an SQLite file, so later runs
+    on the same instance can reuse earlier decodes.
+    """
+
+    def __init__(self, max_size: int = 100_000, path: str | Path | None = None):
+        self.max_size = max_size
+        self.entries: OrderedDict[bytes, float] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.path = path
+        self.connection = None
+        self.pending = 0
+        if path is not None:
+            self.connection = sqlite3.connect(str(path))
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations (key BLOB PRIMARY KEY, fitness)"
+            )
+
+    @staticmethod
+    def key(decoder_name: str, permutation: list[int], compiled=None) -> bytes:
+        """
+        Returns a 16-byte digest identifying the permutation decoded by the decoder.
+        With the CompiledInstance of an instance containing identical items, the
+        digest is taken over the type sequence instead, so permutations that only
+        swap identical items share one entry.
+        """
+        digest = blake2b(decoder_name.encode(), digest_size=16)
+        if compiled is not None and compiled.has_identical_items:
+            digest.update(b"types")
+            digest.update(compiled.type_sequence(permutation).tobytes())
+        else:
+            digest.update(array("q", permutation).tobytes())
+        return digest.digest()
+
+    def get(self, key: bytes) -> float | None:
+        """Returns the cached fitness, or None (and counts a miss)."""
+        fitness = self.entries.get(key)
+        if fitness is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return fitness
+
+        if self.connection is not None:
+            row = self.connection.execute(
+                "SELECT fitness FROM evaluations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                self._remember(key, row[0])
+                return row[0]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: bytes, fitness: float):
+        """Stores a fitness value."""
+        self._remember(key, fitness)
+        if self.connection is not None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO evaluations (key, fitness) VALUES (?, ?)", (key, fitness)
+            )
+            self.pending += 1
+            if self.pending >= 1000:
+                self.connection.commit()
+                self.pending = 0
+
+    def _remember(self, key: bytes, fitness: float):
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def close(self):
+        """Commits pending evaluations and closes the SQLite file."""
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"EvaluationCache(size={len(self.entries)}/{self.max_size}, "
+            f"hits={self.hits}, disk_hits={self.disk_hits}, misses={self.misses})"
+        )
@@ -0,0 +1,282 @@
+import argparse
+import csv
+import json
+from hashlib import blake2b
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from .data.loader import load_beng_instance, INSTANCE_PATTERN
+from .model.solution import Solution
+from .metaheuristics.ga.ga import GeneticAlgorithm
+from .metaheuristics.sa import SimulatedAnnealing
+from .fitness import HeightFitnessEvaluator
+from .constructive_permutation.random_generator import RandomGenerator
+from .constructive_permutation.greedy_generator import GreedyAreaPermutationGenerator
+from .evaluation_cache import EvaluationCache
+from .budget import Budget
+from .multi_run import run_independent
+from .utils import get_decoder, gap
+from .config import ga_parameters, sa_parameters, K_REPEAT_RANDOM, CACHE_SIZE
+
+METHODS = ("GA", "SA", "GREEDY", "RANDOM")
+DEFAULT_DATASET = Path(__file__).resolve().parent / "data" / "BENG"
+
+# Rough decode cost in units of items ** exponent, used only to order the cells
+DECODER_EXPONENT = {1: 2, 2: 2, 3: 2, 4: 1, 5: 1}
+
+SUMMARY_HEADER = ["Instance", "Items", "Lower bound", "Decoder", "Method", "Parameters", "Runs",
+                  "Best", "Mean", "Std", "Worst", "Gap [%]", "Time [s]"]
+
+CONFIG_DEFAULTS = {
+    "dataset": str(DEFAULT_DATASET),
+    "instances": "all",
+    "decoders": [3],
+    "methods": ["GA", "SA"],
+    "parameters": {},
+    "n_runs": 10,
+    "seed": 0,
+    "max_time": None,
+    "max_evaluations": None,
+    "k_random": K_REPEAT_RANDOM,
+    "cache_size": CACHE_SIZE,
+    "output": "experiments",
+}
+
+
+def load_config(path: str) -> dict:
+    """
+    Reads a JSON grid configuration and fills in the defaults. Keys:
+      dataset: directory of .ins2D files (default: the BENG instances)
+      instances: instance names (file names without extension) or "all"
+      decoders: decoder choices of get_decoder
+      methods: any of "GA", "SA", "GREEDY", "RANDOM"
+      parameters: {"GA": {set name: overrides of config.ga_parameters}, "SA": {...}};
+          a method without sets runs once with the config.py parameters ("default")
+      n_runs, seed (master seed of every cell), max_time, max_evaluations, k_random, cache_size
+      output: directory of the cell results and of summary.csv
+    """
+    with open(path) as f:
+        config = {**CONFIG_DEFAULTS, **json.load(f)}
+    unknown = set(config["methods"]) - set(METHODS)
+    if unknown:
+        raise ValueError(f"Unknown methods: {sorted(unknown)}")
+    return config
+
+
+def method_parameters(config: dict, method: str) -> dict[str, dict]:
+    """Returns the named parameter sets of a method, merged over the defaults of config.py."""
+    base = {"GA": ga_parameters, "SA": sa_parameters}.get(method)
+    if base is None:
+        return {"default": {}}
+    sets = config["parameters"].get(method) or {"default": {}}
+    merged = {name: {**base, **overrides} for name, overrides in sets.items()}
+    for name, parameters in merged.items():
+        if parameters.get("islands", 1) > 1 or parameters.get("replicas", 1) > 1:
+            raise ValueError(f"{method} parameters '{name}': islands and replicas start their own "
+                             "processes and are not supported in a grid")
+    return merged
+
+
+def instance_files(config: dict) -> list[Path]:
+    paths = sorted(Path(config["dataset"]).glob(INSTANCE_PATTERN))
+    if config["instances"] != "all":
+        names = set(config["instances"])
+        paths = [p for p in paths if p.stem in names]
+        missing = names - {p.stem for p in paths}
+        if missing:
+            raise ValueError(f"Instances not found in {config['dataset']}: {sorted(missing)}")
+    return paths
+
+
+def expected_evaluations(method: str, parameters: dict, config: dict) -> float:
+    """Evaluations a cell is expected to need, from its parameters and budget."""
+    if method == "GREEDY":
+        return 1
+    if method == "RANDOM":
+        per_run, runs = config["k_random"], 1
+    elif method == "GA":
+        generations = parameters["generations"] or 1000
+        per_run, runs = parameters["population_size"] * (generations + 1), config["n_runs"]
+    else:
+        steps = math.ceil(math.log(parameters["T_min"] / parameters["T0"]) / math.log(parameters["alpha"]))
+        per_run, runs = 1 + steps * parameters["max_iter"], config["n_runs"]
+    if config["max_evaluations"] is not None:
+        per_run = min(per_run, config["max_evaluations"])
+    return per_run * runs
+
+
+def settings_hash(parameters: dict, config: dict) -> str:
+    """
+    Short hash of everything a cell result depends on besides the instance, decoder
+    and method: the merged parameters, n_runs, seed, the budget and k_random.
+    Editing any of them gives the cell a new id, so stale results are not reused.
+    """
+    settings = {"parameters": parameters, **{key: config[key] for key in
+                ("n_runs", "seed", "max_time", "max_evaluations", "k_random")}}
+    return blake2b(json.dumps(settings, sort_keys=True).encode(), digest_size=4).hexdigest()
+
+
+def build_cells(config: dict) -> list[dict]:
+    """
+    Returns one cell per instance x decoder x method x parameter set, ordered
+    longest-expected-first, so that the longest cells do not start last.
+    Cell ids name the decoder class (decoder result names need not be unique)
+    and end with the `settings_hash` of the cell.
+    """
+    cells = []
+    for path in instance_files(config):
+        with open(path) as f:
+            n_items = int(f.readline())
+        for choice in config["decoders"]:
+            decoder_class = type(get_decoder(choice)).__name__
+            for method in config["methods"]:
+                for set_name, parameters in method_parameters(config, method).items():
+                    cost = expected_evaluations(method, parameters, config) * n_items ** DECODER_EXPONENT.get(choice, 2)
+                    cells.append({
+                        "id": f"{path.stem}_{decoder_class}_{method}_{set_name}_{settings_hash(parameters, config)}",
+                        "instance": path.stem,
+                        "path": str(path),
+                        "decoder": choice,
+                        "method": method,
+                        "parameter_set": set_name,
+                        "parameters": parameters,
+                        "cost": cost,
+                    })
+    cells.sort(key=lambda cell: -cell["cost"])
+    return cells
+
+
+def cell_path(output: str, cell: dict) -> Path:
+    return Path(output) / "cells" / f"{cell['id']}.json"
+
+
+def run_cell(cell: dict, config: dict) -> dict:
+    """Runs one cell and returns its result (run fitnesses and summary statistics)."""
+    instance = load_beng_instance(cell["path"])
+    decoder = get_decoder(cell["decoder"])
+    fitness = HeightFitnessEvaluator()
+    item_ids = [item.id for item in instance.items]
+    lower_bound = instance.lower_bound()
+    parameters = cell["parameters"]
+    cache = EvaluationCache(config["cache_size"]) if config["cache_size"] else None
+    budget = None
+    if config["max_time"] is not None or config["max_evaluations"] is not None:
+        budget = Budget(config["max_time"], config["max_evaluations"])
+
+    start = time.perf_counter()
+    if cell["method"] == "GREEDY":
+        solution = Solution(GreedyAreaPermutationGenerator().generate(instance))
+        solution.evaluate(instance, decoder, fitness)
+        fitnesses = [solution.fitness]
+    elif cell["method"] == "RANDOM":
+        random.seed(config["seed"])
+        solutions = RandomGenerator().run_random(instance, decoder, fitness,
+                                                 config["k_random"] if budget is None else None, cache, 1, budget)
+        fitnesses = [sol.fitness for sol in solutions]
+    else:
+        target = lower_bound if parameters.get("stop_at_bound", False) else None
+        if cell["method"] == "GA":
+            run_fn, args = GeneticAlgorithm.single_run, (instance, decoder, fitness, item_ids, parameters, None, budget, target)
+        else:
+            run_fn, args = SimulatedAnnealing.single_run, (instance, decoder, fitness, item_ids, parameters, budget, target)
+        runs = run_independent(run_fn, config["n_runs"], config["seed"], args, cache=cache)
+        fitnesses = [run["best_fitness"] for run in runs]
+    elapsed = time.perf_counter() - start
+
+    return {
+        "instance": cell["instance"],
+        "items": len(instance.items),
+        "lower_bound": lower_bound,
+        "decoder": decoder.name,
+        "method": cell["method"],
+        "parameter_set": cell["parameter_set"],
+        "parameters": parameters,
+        "seed": config["seed"],
+        "fitnesses": fitnesses,
+        "best": min(fitnesses),
+        "mean": round(statistics.fmean(fitnesses), 2),
+        "std": round(statistics.pstdev(fitnesses), 2),
+        "worst": max(fitnesses),
+        "gap": gap(min(fitnesses), lower_bound),
+        "time": round(elapsed, 3),
+    }
+
+
+def save_cell(result: dict, path: Path):
+    """Writes a cell result atomically: a cell file exists only once the cell has finished."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(result, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def save_summary(results: list[dict], csv_filename: str):
+    """One row per cell, sorted by instance, decoder, method and parameter set."""
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SUMMARY_HEADER)
+        for r in sorted(results, key=lambda r: (r["instance"], r["decoder"], r["method"], r["parameter_set"])):
+            writer.writerow([r["instance"], r["items"], r["lower_bound"], r["decoder"], r["method"],
+                             r["parameter_set"], len(r["fitnesses"]), r["best"], r["mean"], r["std"],
+                             r["worst"], r["gap"], r["time"]])
+
+
+def run_grid(config: dict, workers: int = 1, log=print) -> list[dict]:
+    """
+    Runs every cell of the grid whose result file does not exist yet (so an
+    interrupted sweep resumes where it stopped), spread over a process pool,
+    then writes <output>/summary.csv with all cells of the grid.
+    """
+    cells = build_cells(config)
+    todo = [cell for cell in cells if not cell_path(config["output"], cell).exists()]
+    log(f"{len(cells)} cells, {len(cells) - len(todo)} already done, {len(todo)} to run")
+
+    def finished(cell, result):
+        save_cell(result, cell_path(config["output"], cell))
+        log(f"{cell['id']}: best {result['best']} (gap {result['gap']}%) in {result['time']} s")
+
+    if workers <= 1:
+        for cell in todo:
+            finished(cell, run_cell(cell, config))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_cell, cell, config): cell for cell in todo}
+            for future in as_completed(futures):
+                finished(futures[future], future.result())
+
+    results = []
+    for cell in cells:
+        with open(cell_path(config["output"], cell)) as f:
+            results.append(json.load(f))
+    save_summary(results, str(Path(config["output"]) / "summary.csv"))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__spec__.name}",
+        description="Runs an instance x decoder x method x parameter grid and writes one summary CSV.")
+    parser.add_argument("config", help="JSON grid configuration")
+    parser.add_argument("--workers", type=int, default=1, help="processes running cells in parallel")
+    parser.add_argument("--dry-run", action="store_true", help="only list the cells in the order they would run")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    if args.dry_run:
+        for cell in build_cells(config):
+            done = "done" if cell_path(config["output"], cell).exists() else ""
+            print(f"{cell['id']:<60} {cell['cost']:>16.3g} {done}")
+        return 0
+    run_grid(config, args.workers)
+    print(f"Summary saved to {Path(config['output']) / 'summary.csv'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 # heuristics/fitness.py
 from abc import ABC, abstractmethod
 from .model.placement import Placement
+from .model.compiled import PlacementBuffer
 
 class FitnessEvaluator(ABC):
     """
@@ -23,10 +24,13 @@ class HeightFitnessEvaluator(FitnessEvaluator):
     Lower fitness is better.
     """
 
-    def evaluate(self, placements: list[Placement]) -> float:
+    def evaluate(self, placements: list[Placement] | PlacementBuffer) -> float:
         if not placements:
             return 0.0
 
+        if isinstance(placements, PlacementBuffer):
+            return placements.max_top()
+
         # Maksymalna wysokość z wszystkich prostokątów
         max_height = max(p.y + p.item.height for p in placements)
         return max_height
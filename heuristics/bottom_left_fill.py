@@ -1,111 +1,202 @@
+from bisect import bisect_left, insort
 from ..data.loader import BinPackingInstance
-from .decoder import Decoder
+from .decoder import Decoder, DecoderState
 from ..model.placement import Placement
 
 
-class BottomLeftFill(Decoder):
-  
-    name = "BLF"
-
-    def decode(self, instance: BinPackingInstance, permutation: list[int]) -> list[Placement]:
-        placements = []
-        item_map = {item.id: item for item in instance.items}
-
-        INF = 10**9
-        free_rects = [(0, 0, instance.bin_width, INF)]
-
-        for item_id in permutation:
-            item = item_map[item_id]
-
+class BottomLeftFillState(DecoderState):
+    """Placements together with the free rectangles."""
 
-            best = None
-            best_key = None
+    def __init__(self, free_rects: "FreeRectangles"):
+        super().__init__()
+        self.free_rects = free_rects
 
-            for r in free_rects:
-                rx, ry, rw, rh = r
-                if item.width <= rw and item.height <= rh:
-                    key = (ry, rx)
-                    if best_key is None or key < best_key:
-                        best_key = key
-                        best = r
+    def copy(self) -> "BottomLeftFillState":
+        new_state = BottomLeftFillState(self.free_rects.copy())
+        new_state.placements = self.placements.copy()
+        return new_state
 
-            if best is None:
-                current_height = max((p.top for p in placements), default=0)
-                best = (0, current_height, instance.bin_width, INF)
-                free_rects.append(best)
 
-            rx, ry, rw, rh = best
-            placement = Placement(item, rx, ry)
-            placements.append(placement)
+class BottomLeftFill(Decoder):
+  
+    name = "BLF"
+    INF = 10**9
+
+    def initial_state(self, instance: BinPackingInstance) -> BottomLeftFillState:
+        return BottomLeftFillState(FreeRectangles((0, 0, instance.bin_width, self.INF)))
+
+    def place(self, instance: BinPackingInstance, state: BottomLeftFillState, index: int) -> float:
+        item = instance.compiled.items[index]
+        placements = state.placements
+        free_rects = state.free_rects
+
+        best = free_rects.best_fit(item.width, item.height)
+
+        if best is None:
+            current_height = max((p.top for p in placements), default=0)
+            best = (0, current_height, instance.bin_width, self.INF)
+            free_rects.add(best)
+
+        rx, ry, rw, rh = best
+        placement = Placement(item, rx, ry)
+        placements.append(placement)
+
+        free_rects.place(placement)
+        return placement.top
+
+
+# ---------- GEOMETRY ----------
+# Rectangles are (x, y, width, height) tuples.
+
+def rect_intersects(rect, placement) -> bool:
+    """True if the free rectangle and the placement overlap (touching edges do not)."""
+    rx, ry, rw, rh = rect
+    return not (
+        rx + rw <= placement.x or
+        placement.right <= rx or
+        ry + rh <= placement.y or
+        placement.top <= ry
+    )
+
+
+def split_rect(rect, placement) -> list:
+    """Splits a free rectangle into the (overlapping) maximal parts left, right, below and above the placement."""
+    rx, ry, rw, rh = rect
+    px, py = placement.x, placement.y
+    pw, ph = placement.width, placement.height
+
+    new_rects = []
+
+    # left
+    if rx < px:
+        new_rects.append((rx, ry, px - rx, rh))
+
+    # right
+    if rx + rw > px + pw:
+        new_rects.append((px + pw, ry, rx + rw - (px + pw), rh))
+
+    # bottom
+    if ry < py:
+        new_rects.append((rx, ry, rw, py - ry))
+
+    # upper
+    if ry + rh > py + ph:
+        new_rects.append((rx, py + ph, rw, ry + rh - (py + ph)))
+
+    return new_rects
+
+
+def prune_rects(rects) -> list:
+    """Removes regions dominated by others (the full rebuild used after a rectangle is added by hand)."""
+    result = []
+    for r in rects:
+        rx, ry, rw, rh = r
+        dominated = False
+        for o in rects:
+            if r == o:
+                continue
+            ox, oy, ow, oh = o
+            if (
+                rx >= ox and ry >= oy and
+                rx + rw <= ox + ow and
+                ry + rh <= oy + oh
+            ):
+                dominated = True
+                break
+        if not dominated and rw > 0 and rh > 0:
+            result.append(r)
+    return result
+
+
+class FreeRectangles:
+    """
+    Maximal free rectangles of a BLF packing, kept sorted by (y, x).
+    A placement only splits and prunes the rectangles it intersects, and
+    the best fit is the first rectangle in (y, x) order the item fits into.
+    Rectangles are (x, y, width, height) tuples.
+    """
+
+    def __init__(self, rect):
+        # Stored as (y, x, width, height) so that list order is (y, x) order
+        self.rects = [(rect[1], rect[0], rect[2], rect[3])]
+        # Set when a rectangle was added without pruning
+        self.dirty = False
+
+    def copy(self) -> "FreeRectangles":
+        new_rects = FreeRectangles.__new__(FreeRectangles)
+        new_rects.rects = self.rects.copy()
+        new_rects.dirty = self.dirty
+        return new_rects
 
+    def __len__(self):
+        return len(self.rects)
+
+    def __iter__(self):
+        for ry, rx, rw, rh in self.rects:
+            yield (rx, ry, rw, rh)
+
+    def best_fit(self, width: float, height: float):
+        """Returns the free rectangle with the lowest (y, x) that fits the item, or None."""
+        for ry, rx, rw, rh in self.rects:
+            if width <= rw and height <= rh:
+                return (rx, ry, rw, rh)
+        return None
+
+    def add(self, rect):
+        """Adds a rectangle without splitting or pruning."""
+        insort(self.rects, (rect[1], rect[0], rect[2], rect[3]))
+        self.dirty = True
+
+    def place(self, placement: Placement):
+        """Splits and prunes the free rectangles intersecting the placement."""
+        if self.dirty:
+            # A rectangle added by hand may dominate any other one
+            rects = list(self)
             new_free = []
-
-            for r in free_rects:
-                if not self._rect_intersect(r, placement):
+            for r in rects:
+                if not rect_intersects(r, placement):
                     new_free.append(r)
                 else:
-                    new_free.extend(self._split_rect(r, placement))
-
-            free_rects = self._prune(new_free)
-
-        return placements
-
-    # ---------- GEOMETRY ----------
-
-    @staticmethod
-    def _rect_intersect(rect, placement):
+                    new_free.extend(split_rect(r, placement))
+            self.rects = sorted(set((ry, rx, rw, rh) for rx, ry, rw, rh in prune_rects(new_free)))
+            self.dirty = False
+            return
+
+        # Only rectangles starting below the top of the placement can intersect it
+        stop = bisect_left(self.rects, (placement.top,))
+        kept = []
+        fragments = []
+        for stored in self.rects[:stop]:
+            ry, rx, rw, rh = stored
+            r = (rx, ry, rw, rh)
+            if rect_intersects(r, placement):
+                fragments.extend(split_rect(r, placement))
+            else:
+                kept.append(stored)
+        if len(kept) == stop:
+            return
+        self.rects[:stop] = kept
+
+        for f in set(fragments):
+            if not self._dominated(f, fragments):
+                fx, fy, fw, fh = f
+                insort(self.rects, (fy, fx, fw, fh))
+
+    def _dominated(self, rect, fragments) -> bool:
+        """Checks whether rect lies inside another free rectangle or fragment."""
         rx, ry, rw, rh = rect
-        return not (
-            rx + rw <= placement.x or
-            placement.right <= rx or
-            ry + rh <= placement.y or
-            placement.top <= ry
-        )
-
-    @staticmethod
-    def _split_rect(rect, placement):
-        rx, ry, rw, rh = rect
-        px, py = placement.x, placement.y
-        pw, ph = placement.width, placement.height
-
-        new_rects = []
-
-        # left
-        if rx < px:
-            new_rects.append((rx, ry, px - rx, rh))
-
-        # right
-        if rx + rw > px + pw:
-            new_rects.append((px + pw, ry, rx + rw - (px + pw), rh))
-
-        # bottom
-        if ry < py:
-            new_rects.append((rx, ry, rw, py - ry))
-
-        # upper
-        if ry + rh > py + ph:
-            new_rects.append((rx, py + ph, rw, ry + rh - (py + ph)))
-
-        return new_rects
-
-    @staticmethod
-    def _prune(rects):
-        """Removes regions dominated by others."""
-        result = []
-        for r in rects:
-            rx, ry, rw, rh = r
-            dominated = False
-            for o in rects:
-                if r == o:
-                    continue
-                ox, oy, ow, oh = o
-                if (
-                    rx >= ox and ry >= oy and
-                    rx + rw <= ox + ow and
-                    ry + rh <= oy + oh
-                ):
-                    dominated = True
-                    break
-            if not dominated and rw > 0 and rh > 0:
-                result.append(r)
-        return result
+        stop = bisect_left(self.rects, (ry, float("inf")))
+        for oy, ox, ow, oh in self.rects[:stop]:
+            if (rx >= ox and rx + rw <= ox + ow and ry + rh <= oy + oh):
+                return True
+        for o in fragments:
+            if o == rect:
+                continue
+            ox, oy, ow, oh = o
+            if (
+                rx >= ox and ry >= oy and
+                rx + rw <= ox + ow and
+                ry + rh <= oy + oh
+            ):
+                return True
+        return False
@@ -1,6 +1,48 @@
 from abc import ABC, abstractmethod
+from math import ceil
 from ..model.instance import BinPackingInstance
 from ..model.placement import Placement
+from ..instrumentation import timed
+
+
+class DecoderState():
+    """
+    Partial packing built by a decoder.
+    Decoders keep their own structures (index, skyline, free rectangles)
+    in subclasses; `copy` must not share anything that `place` mutates.
+    placements is a list of Placement objects or a PlacementBuffer.
+    """
+
+    def __init__(self):
+        self.placements: list[Placement] = []
+
+    def copy(self) -> "DecoderState":
+        new_state = DecoderState()
+        new_state.placements = self.placements.copy()
+        return new_state
+
+
+class Checkpoints():
+    """
+    Decoder states saved every `interval` items of a permutation.
+    states[k] is the state after the first k items have been placed.
+    Saved states are never modified, so they can be shared between solutions.
+    """
+
+    def __init__(self, interval: int, states: dict[int, DecoderState] | None = None):
+        self.interval = interval
+        self.states: dict[int, DecoderState] = states if states is not None else {}
+
+    def nearest(self, prefix: int) -> int:
+        """Returns the largest checkpoint index not greater than prefix (0 if none)."""
+        k = (prefix // self.interval) * self.interval
+        while k > 0 and k not in self.states:
+            k -= self.interval
+        return max(k, 0)
+
+    def __len__(self):
+        return len(self.states)
+
 
 class Decoder():
 
@@ -11,9 +53,69 @@ class Decoder():
     def __init__(self):
         pass
 
-    @abstractmethod
-    def decode(self, instance: BinPackingInstance, permutation: list[int]) -> list[Placement]:
+    @timed("decode", per_class=True)
+    def decode(self, instance: BinPackingInstance, permutation: list[int],
+               cutoff: float | None = None) -> list[Placement]:
         """
         Decodes a permutation into a list of placements.
+        If a cutoff height is given, decoding stops as soon as a placement
+        reaches above it, so fewer placements than items are returned.
         """
-        pass
\ No newline at end of file
+        index = instance.compiled.index
+        state = self.initial_state(instance)
+        for item_id in permutation:
+            top = self.place(instance, state, index[item_id])
+            if cutoff is not None and top > cutoff:
+                break
+        return state.placements
+
+    @timed("decode_resumable", per_class=True)
+    def decode_resumable(self, instance: BinPackingInstance, permutation: list[int],
+                         max_checkpoints: int, parent: Checkpoints | None = None,
+                         prefix: int = 0, cutoff: float | None = None) -> tuple[list[Placement], Checkpoints]:
+        """
+        Decodes a permutation keeping up to max_checkpoints intermediate states.
+        If parent checkpoints are given and the first `prefix` items of the
+        permutation are the same as in the parent's permutation, decoding
+        resumes from the parent's nearest checkpoint instead of from scratch.
+        The cutoff works as in `decode`.
+        """
+        n = len(permutation)
+        interval = max(1, ceil(n / (max_checkpoints + 1)))
+        checkpoints = Checkpoints(interval)
+
+        start = 0
+        if parent is not None and parent.interval == interval:
+            start = parent.nearest(prefix)
+            for k, saved in parent.states.items():
+                if k <= start:
+                    checkpoints.states[k] = saved
+
+        if start > 0:
+            state = checkpoints.states[start].copy()
+        else:
+            state = self.initial_state(instance)
+
+        index = instance.compiled.index
+        for k in range(start, n):
+            if k > start and k % interval == 0:
+                checkpoints.states[k] = state.copy()
+            top = self.place(instance, state, index[permutation[k]])
+            if cutoff is not None and top > cutoff:
+                break
+
+        return state.placements, checkpoints
+
+    def initial_state(self, instance: BinPackingInstance) -> DecoderState:
+        """
+        Returns the state of an empty strip.
+        """
+        return DecoderState()
+
+    @abstractmethod
+    def place(self, instance: BinPackingInstance, state: DecoderState, index: int) -> float:
+        """
+        Places the item with the given index in instance.compiled, appending
+        its placement to state.placements, and returns its top edge.
+        """
+        pass
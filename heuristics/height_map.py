@@ -0,0 +1,63 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from ..model.instance import BinPackingInstance
+from ..model.compiled import CompiledInstance, PlacementBuffer
+from .decoder import Decoder, DecoderState
+
+
+class HeightMapState(DecoderState):
+    """Placement buffer together with the height of every column of the strip."""
+
+    def __init__(self, compiled: CompiledInstance):
+        super().__init__()
+        self.placements = PlacementBuffer(compiled)
+        self.heights = np.zeros(int(compiled.bin_width), dtype=np.int64)
+
+    def copy(self) -> "HeightMapState":
+        new_state = HeightMapState.__new__(HeightMapState)
+        new_state.placements = self.placements.copy()
+        new_state.heights = self.heights.copy()
+        return new_state
+
+
+class HeightMap(Decoder):
+    """
+    Bottom-Left decoder working on a per-column height map.
+    Keeps the height of every unit column of the strip in a NumPy array and
+    puts each item at the lowest, then leftmost, x found with a vectorized
+    sliding-window maximum. Only instances with integer dimensions are
+    supported.
+    """
+
+    name = "HMAP"
+
+    def initial_state(self, instance: BinPackingInstance) -> HeightMapState:
+        self._check_integer(instance)
+        return HeightMapState(instance.compiled)
+
+    def place(self, instance: BinPackingInstance, state: HeightMapState, index: int) -> float:
+        heights = state.heights
+        width = int(instance.compiled.widths[index])
+        height = int(instance.compiled.heights[index])
+
+        if width > len(heights):
+            # Wider than the strip: put it on top of everything
+            top = int(heights.max())
+            state.placements.append(index, 0, top)
+            heights[:] = top + height
+            return top + height
+
+        # Supporting height for every feasible x
+        support = sliding_window_view(heights, width).max(axis=1)
+        x = int(support.argmin())
+        y = int(support[x])
+
+        state.placements.append(index, x, y)
+        heights[x:x + width] = y + height
+        return y + height
+
+    @staticmethod
+    def _check_integer(instance: BinPackingInstance):
+        """Raises ValueError if the strip or any item has non-integer dimensions (cached per instance)."""
+        if not instance.compiled.has_integer_dimensions:
+            raise ValueError(f"{HeightMap.__name__} requires integer dimensions")
@@ -0,0 +1,98 @@
+from ..model.instance import BinPackingInstance
+from ..model.compiled import CompiledInstance, PlacementBuffer
+from .decoder import Decoder, DecoderState
+
+
+class SkylineState(DecoderState):
+    """Placement buffer together with the skyline segments."""
+
+    def __init__(self, compiled: CompiledInstance):
+        super().__init__()
+        self.placements = PlacementBuffer(compiled)
+        self.xs: list[float] = [0]
+        self.ys: list[float] = [0]
+
+    def copy(self) -> "SkylineState":
+        new_state = SkylineState.__new__(SkylineState)
+        new_state.placements = self.placements.copy()
+        new_state.xs = self.xs.copy()
+        new_state.ys = self.ys.copy()
+        return new_state
+
+
+class Skyline(Decoder):
+    """
+    Bottom-Left decoder working on a skyline.
+    The packing is kept as a sorted list of horizontal segments
+    (segment i covers [xs[i], xs[i+1]) at height ys[i]); every item is put
+    at the left end of the segment that gives the lowest (y, x) position,
+    so a placement costs O(segments) instead of a scan over all placements.
+    Space below the skyline is never reused.
+    """
+
+    name = "SKY"
+
+    def initial_state(self, instance: BinPackingInstance) -> SkylineState:
+        return SkylineState(instance.compiled)
+
+    def place(self, instance: BinPackingInstance, state: SkylineState, index: int) -> float:
+        bin_width = instance.bin_width
+        xs = state.xs
+        ys = state.ys
+        width = instance.compiled.widths[index]
+        height = instance.compiled.heights[index]
+
+        best_key = None
+        best_span = None
+
+        n = len(xs)
+        for i in range(n):
+            x = xs[i]
+            right = x + width
+            if right > bin_width:
+                break
+
+            # Highest segment under [x, x + width)
+            y = ys[i]
+            j = i + 1
+            while j < n and xs[j] < right:
+                if ys[j] > y:
+                    y = ys[j]
+                j += 1
+
+            key = (y, x)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_span = (i, j)
+
+        if best_key is None:
+            # Wider than the strip: put it on top of everything
+            top = max(ys)
+            state.placements.append(index, 0, top)
+            xs[:] = [0]
+            ys[:] = [top + height]
+            return top + height
+
+        y, x = best_key
+        i, j = best_span
+        state.placements.append(index, x, y)
+        self._raise(xs, ys, i, j, x + width, y + height, bin_width)
+        return y + height
+
+    @staticmethod
+    def _raise(xs, ys, i, j, right, top, bin_width):
+        """Replaces segments i..j-1 by a segment [xs[i], right) at height top."""
+        end = xs[j] if j < len(xs) else bin_width
+        if right < end:
+            # The last covered segment sticks out on the right
+            xs[i:j] = [xs[i], right]
+            ys[i:j] = [top, ys[j - 1]]
+        else:
+            xs[i:j] = [xs[i]]
+            ys[i:j] = [top]
+
+        # Merge with neighbours of equal height
+        for k in (i + 1, i):
+            if 1 <= k < len(xs) and ys[k] == ys[k - 1]:
+                del xs[k]
+                del ys[k]
@@ -0,0 +1,127 @@
+import functools
+import json
+import os
+from time import perf_counter_ns
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "timed", "count", "summary", "write_trace"]
+
+# Events kept for the trace file; timers and counters are always complete
+MAX_TRACE_EVENTS = 100_000
+
+
+class _State:
+    """Process-wide instrumentation data. While disabled, instrumented calls only check `enabled`."""
+
+    def __init__(self):
+        self.enabled = os.environ.get("PACKING_PROFILE", "") not in ("", "0")
+        self.start = perf_counter_ns()
+        self.timers: dict[str, list[int]] = {}     # name -> [calls, total ns]
+        self.counters: dict[str, int] = {}
+        self.events: list[tuple[str, int, int]] = []  # (name, start ns, duration ns)
+        self.dropped_events = 0
+
+
+_state = _State()
+
+
+def enable():
+    """Turns instrumentation on; the wall time of the summary starts here unless it was already on."""
+    if not _state.enabled:
+        reset()
+        _state.enabled = True
+
+
+def disable():
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset():
+    """Clears all timers, counters and trace events."""
+    enabled = _state.enabled
+    _state.__init__()
+    _state.enabled = enabled
+
+
+def _record(name: str, start: int, end: int):
+    timer = _state.timers.get(name)
+    if timer is None:
+        timer = _state.timers[name] = [0, 0]
+    timer[0] += 1
+    timer[1] += end - start
+    if len(_state.events) < MAX_TRACE_EVENTS:
+        _state.events.append((name, start, end - start))
+    else:
+        _state.dropped_events += 1
+
+
+def timed(name: str, per_class: bool = False):
+    """
+    Decorator adding a cumulative timer (and trace events) to a function.
+    With per_class=True the timer name gets the class of the first argument
+    appended (e.g. "decode/Skyline"), so one method is timed per subclass.
+    While instrumentation is disabled the wrapper only checks a flag.
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return function(*args, **kwargs)
+            key = f"{name}/{type(args[0]).__name__}" if per_class else name
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(key, start, perf_counter_ns())
+        return wrapper
+    return decorate
+
+
+def count(name: str, n: int = 1):
+    """Increments a counter (only while instrumentation is enabled)."""
+    if _state.enabled:
+        _state.counters[name] = _state.counters.get(name, 0) + n
+
+
+def summary() -> str:
+    """
+    Returns a table of the timers sorted by total time, followed by the counters.
+    Times are inclusive: a timer contains the timers called inside it.
+    """
+    wall = (perf_counter_ns() - _state.start) / 1e9
+    lines = [f"{'name':<40} {'calls':>10} {'total s':>10} {'mean us':>12} {'% wall':>7}"]
+    for name, (calls, total) in sorted(_state.timers.items(), key=lambda t: -t[1][1]):
+        lines.append(f"{name:<40} {calls:>10} {total / 1e9:>10.3f} {total / calls / 1e3:>12.1f} "
+                     f"{100 * total / 1e9 / wall:>6.1f}%")
+    for name, value in sorted(_state.counters.items()):
+        lines.append(f"{name:<40} {value:>10}")
+    lines.append(f"wall time {wall:.3f} s")
+    return "\n".join(lines)
+
+
+def write_trace(path: str):
+    """
+    Writes the trace events in the Chrome trace format (chrome://tracing,
+    Perfetto), with the timers and counters under "otherData".
+    Only events of this process are included.
+    """
+    pid = os.getpid()
+    trace_events = [
+        {"name": name, "ph": "X", "ts": (start - _state.start) / 1e3, "dur": duration / 1e3,
+         "pid": pid, "tid": 0}
+        for name, start, duration in _state.events
+    ]
+    report = {
+        "traceEvents": trace_events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "timers": {name: {"calls": calls, "total_s": total / 1e9} for name, (calls, total) in _state.timers.items()},
+            "counters": dict(_state.counters),
+            "dropped_events": _state.dropped_events,
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(report, f)
@@ -0,0 +1,68 @@
+import numpy as np
+from ...instrumentation import timed
+
+# Batched GA operators of the vectorized mode: a population is a 2-D array with
+# one permutation of item indices (0..n-1) per row; rng is a numpy Generator.
+# Kept apart from genetic_operators, so list-based runs do not import numpy.
+
+
+@timed("tournament_selection_batch")
+def tournament_selection_batch(fitnesses: np.ndarray, k: int, n: int, rng: np.random.Generator,
+                               complete=None) -> np.ndarray:
+        """
+        Runs n tournaments of k distinct individuals at once.
+        Returns the row indices of the n winners.
+        complete(candidates, winners), if given, may update fitnesses in place and
+        return True (e.g. after decoding cut-off contestants to the end); the
+        winners are then chosen again.
+        """
+        size = len(fitnesses)
+        candidates = np.argpartition(rng.random((n, size)), k - 1, axis=1)[:, :k]
+        winners = candidates[np.arange(n), fitnesses[candidates].argmin(axis=1)]
+        if complete is not None and complete(candidates, winners):
+            winners = candidates[np.arange(n), fitnesses[candidates].argmin(axis=1)]
+        return winners
+
+
+def random_segments(n: int, size: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """Returns n pairs i < j of distinct positions in range(size)."""
+        a = rng.integers(0, size, n)
+        b = rng.integers(0, size - 1, n)
+        b += b >= a
+        return np.minimum(a, b), np.maximum(a, b)
+
+
+@timed("ordered_crossover_batch")
+def ordered_crossover_batch(parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Order crossover of every row pair in O(n) per child: the child keeps
+        parent1[i:j+1] in place and the other positions are filled, left to
+        right, with the remaining items in parent2's order.
+        """
+        n, size = parents1.shape
+        i, j = random_segments(n, size, rng)
+        positions = np.arange(size)
+        keep = (positions >= i[:, None]) & (positions <= j[:, None])
+
+        # in_segment[r, item] tells whether the item is kept from parent1 in row r
+        rows = np.arange(n)[:, None]
+        in_segment = np.empty((n, size), dtype=bool)
+        in_segment[rows, parents1] = keep
+        from_parent2 = ~in_segment[rows, parents2]
+
+        # Both masks select size - (j - i + 1) entries per row, in row-major order
+        children = parents1.copy()
+        children[~keep] = parents2[from_parent2]
+        return children
+
+
+@timed("inversion_mutation_batch")
+def inversion_mutation_batch(population: np.ndarray, mutation_rate: float, rng: np.random.Generator) -> np.ndarray:
+        """Reverses a random segment of each row with probability mutation_rate."""
+        n, size = population.shape
+        mutate = rng.random(n) < mutation_rate
+        i, j = random_segments(n, size, rng)
+        positions = np.arange(size)
+        inside = mutate[:, None] & (positions >= i[:, None]) & (positions <= j[:, None])
+        source = np.where(inside, i[:, None] + j[:, None] - positions, positions)
+        return np.take_along_axis(population, source, axis=1)
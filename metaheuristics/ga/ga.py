@@ -1,6 +1,12 @@
 import random
 from ...model.solution import Solution
 from ...model.instance import BinPackingInstance
+from ...batch_evaluator import BatchEvaluator
+from ...budget import Budget
+from ...instrumentation import timed, count
+from ...convergence import ConvergenceTrace
+from ...checkpoint import checkpoint_path, checkpoint_master_seed, save_checkpoint, load_checkpoint, run_parameters
+from ...multi_run import run_independent, new_master_seed
 from ...utils import *
 
 from .genetic_operators import tournament_selection, ordered_crossover, inversion_mutation
@@ -10,16 +16,29 @@ class GeneticAlgorithm:
     """
     Genetic Algorithm for 2D Strip Packing Problem (2D-SPP).
     Operates on permutations of items using a given decoder and fitness evaluator.
+    With vectorized=True the population is also kept as a 2-D array of item-index
+    permutations (`permutations`) and a fitness vector (`fitnesses`), and selection,
+    crossover and mutation are applied to the whole generation at once with batched
+    numpy draws; only decoding stays per individual. The numpy generator is seeded
+    from `random`, so such runs are reproducible, but differ from list-based runs.
+    numpy is imported by the vectorized mode only.
     """
     def __init__(self, 
                  instance: BinPackingInstance,
                  population_size: int,
-                 generations: int,
+                 generations: int | None,
                  mutation_rate: float,
                  crossover_rate: float,
                  tournament_size: int,
                  decoder,
-                 fitness_evaluator):
+                 fitness_evaluator,
+                 checkpoints: int = 0,
+                 cache=None,
+                 cutoff: str | None = None,
+                 evaluator: BatchEvaluator | None = None,
+                 vectorized: bool = False,
+                 budget: Budget | None = None,
+                 target: float | None = None):
         self.instance = instance
         self.population_size = population_size
         self.generations = generations
@@ -28,10 +47,64 @@ class GeneticAlgorithm:
         self.tournament_size = tournament_size
         self.decoder = decoder
         self.fitness_evaluator = fitness_evaluator
+        self.checkpoints = checkpoints
+        self.cache = cache
+        # None, "best" (best-so-far fitness) or "worst" (worst fitness of the parents' generation)
+        self.cutoff = cutoff
+        # Serial evaluation unless a (possibly parallel) BatchEvaluator is given
+        self.evaluator = evaluator if evaluator is not None else BatchEvaluator(
+            instance, decoder, fitness_evaluator, cache=cache)
         self.population: list[Solution] = []
+        # Optional Budget; evolution stops after the generation that exhausts it,
+        # which is cut to the evaluations left
+        self.budget = budget
+        # Evolution stops once the best fitness reaches target (e.g. a lower bound of the instance)
+        self.target = target
+        # Improvement events (time, evaluations, best fitness) of the run
+        self.trace = ConvergenceTrace()
+        # Completed generations and the (best, worst, average) fitness of every generation so far
+        self.generation = 0
+        self.history: list[tuple[float, float, float]] = []
+        # ga_parameters the run was created from (stored with checkpoints)
+        self.parameters: dict | None = None
+        if generations is None and budget is None:
+            raise ValueError("generations can be None only with a budget")
+
+        self.vectorized = vectorized
+        if vectorized:
+            import numpy as np
+            self.rng = np.random.default_rng(random.getrandbits(64))
+            self.item_ids = np.frombuffer(instance.compiled.ids, dtype=np.int64)
+            self.permutations: np.ndarray | None = None
+            self.fitnesses: np.ndarray | None = None
+
+    @staticmethod
+    def from_parameters(instance, decoder, fitness, parameters, cache=None, evaluator=None,
+                        budget=None, target=None) -> "GeneticAlgorithm":
+        """Creates a GeneticAlgorithm from a ga_parameters dictionary."""
+        ga = GeneticAlgorithm(
+            instance=instance,
+            population_size=parameters["population_size"],
+            generations=parameters["generations"],
+            mutation_rate=parameters["mutation_rate"],
+            crossover_rate=parameters["crossover_size"],
+            tournament_size=parameters["tournament_size"],
+            decoder=decoder,
+            fitness_evaluator=fitness,
+            checkpoints=parameters.get("checkpoints", 0),
+            cache=cache,
+            cutoff=parameters.get("cutoff"),
+            evaluator=evaluator,
+            vectorized=parameters.get("vectorized", False),
+            budget=budget,
+            target=target
+        )
+        ga.parameters = parameters
+        return ga
 
     @staticmethod
-    def run_ga(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name):
+    def run_ga(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name, cache=None, workers=1,
+               run_workers=1, seed=None, budget=None, lower_bound=None):
         """
         Runs multiple executions of the Genetic Algorithm (GA) for the 2D Bin Packing problem.
         For each run, it initializes a population, evolves it, and records the best solution found.
@@ -42,6 +115,16 @@ class GeneticAlgorithm:
             fitness: Fitness function to evaluate solutions.
             item_ids: List of item IDs to be packed.
             N_RUNS: Number of independent GA runs.
+            cache: Optional EvaluationCache shared by all runs.
+            workers: Number of processes decoding each generation (1 = serial).
+            run_workers: Number of processes executing whole runs in parallel (1 = serial);
+                with run_workers > 1 every run decodes serially in its own process.
+            seed: Master seed; run k is seeded with run_seed(seed, k) (None = random seed, logged).
+            budget: Optional Budget applied to every run separately.
+            lower_bound: Optional lower bound of the instance, reported as a gap in the CSV;
+                with parameters["stop_at_bound"] a run stops once it reaches the bound.
+            With parameters["checkpoint_every"] or parameters["resume"], every run keeps a
+            checkpoint in {instance_name}/checkpoints; resuming without a seed reuses the saved master seed.
 
         Returns:
             best_solution: The best Solution found among all runs.
@@ -50,89 +133,329 @@ class GeneticAlgorithm:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
         logger = logging.getLogger(__name__)
 
-        all_run_stats = []
-        for run_idx in range(N_RUNS):
-            ga = GeneticAlgorithm(
-                instance=instance,
-                population_size=parameters["population_size"],
-                generations=parameters["generations"],
-                mutation_rate=parameters["mutation_rate"],
-                crossover_rate=parameters["crossover_size"],
-                tournament_size=parameters["tournament_size"],
-                decoder=decoder,
-                fitness_evaluator=fitness
-            )
-            ga.initialize_population(item_ids)
-            bests, worsts, avgs = ga.evolve()
-            all_run_stats.append({
-                'bests': bests,
-                'worsts': worsts,
-                'avgs': avgs,
-                'solution': ga.best_solution,
-                'best_fitness': ga.best_solution.fitness
-            })
+        target = lower_bound if parameters.get("stop_at_bound", False) else None
+        checkpoint_dir = None
+        if parameters.get("checkpoint_every", 0) or parameters.get("resume", False):
+            checkpoint_dir = f"{instance_name}/checkpoints"
+            # Checkpoints are found by the run seeds, so a resumed run reuses the saved master seed
+            seed = checkpoint_master_seed(checkpoint_dir, "GA", decoder.name, seed,
+                                          parameters.get("resume", False))
+        elif seed is None:
+            seed = new_master_seed()
+        logger.info(f"GA master seed: {seed}")
 
+        evaluator = None
+        if run_workers <= 1:
+            evaluator = BatchEvaluator(instance, decoder, fitness, workers=workers, cache=cache)
+        runs = run_independent(GeneticAlgorithm.single_run, N_RUNS, seed,
+                               (instance, decoder, fitness, item_ids, parameters, evaluator, budget, target,
+                                checkpoint_dir),
+                               workers=run_workers, cache=cache)
+        all_run_stats = []
+        for run_idx, stats in enumerate(runs):
+            stats['solution'] = Solution(stats.pop('permutation'))
+            stats['solution'].assign(instance, decoder, stats['best_fitness'])
+            all_run_stats.append(stats)
             logger.info(f"Run {run_idx+1}/{N_RUNS} completed.")
 
+        if evaluator is not None:
+            evaluator.close()
         best = best_run(all_run_stats)
         plot_convergence(best['bests'],best['worsts'],best['avgs'],f"{instance_name}/GA_best_{decoder.name}_{instance_name}.png","GA Best Run")
-        best_index = save_ga_sa_result(all_run_stats, f'{instance_name}/GA_results_{decoder.name}_{instance_name}.csv')
+        best_index = save_ga_sa_result(all_run_stats, f'{instance_name}/GA_results_{decoder.name}_{instance_name}.csv', lower_bound)
+        report_convergence([run["trace"] for run in all_run_stats], instance_name, "GA", decoder.name)
         best_solution = all_run_stats[best_index]["solution"]
         return best_solution
 
+    @staticmethod
+    def single_run(seed, cache, instance, decoder, fitness, item_ids, parameters, evaluator=None,
+                   budget=None, target=None, checkpoint_dir=None) -> dict:
+        """
+        Executes one GA run with the random generator seeded with seed (and the budget restarted).
+        With checkpoint_dir, the run is checkpointed every parameters["checkpoint_every"]
+        generations and, with parameters["resume"], continues from its last checkpoint.
+        Returns the per-generation statistics and the best permutation and fitness
+        (plain values, so the result can be sent back from a worker process).
+        """
+        random.seed(seed)
+        if budget is not None:
+            budget.start()
+        ga = GeneticAlgorithm.from_parameters(instance, decoder, fitness, parameters, cache, evaluator, budget, target)
+        checkpoint_file = None
+        state = None
+        if checkpoint_dir is not None:
+            checkpoint_file = checkpoint_path(checkpoint_dir, "GA", decoder.name, seed)
+            if parameters.get("resume", False):
+                state = load_checkpoint(checkpoint_file, parameters)
+        if state is not None:
+            ga.restore(state)
+        else:
+            ga.initialize_population(item_ids)
+        bests, worsts, avgs = ga.evolve(checkpoint_file, parameters.get("checkpoint_every", 0))
+        return {
+            'bests': bests,
+            'worsts': worsts,
+            'avgs': avgs,
+            'permutation': ga.best_solution.permutation,
+            'best_fitness': ga.best_solution.fitness,
+            'trace': ga.trace.events
+        }
+
 
     def initialize_population(self, items_ids: list[int]):
+        if self.vectorized:
+            import numpy as np
+            index = self.instance.compiled.index
+            base = np.array([index[item_id] for item_id in items_ids], dtype=np.int64)
+            self.best_solution = None
+            self.set_permutations(self.rng.permuted(np.tile(base, (self.offspring_count(), 1)), axis=1))
+            self.update_best(self.population)
+            return
+
         self.population = []
-        for _ in range(self.population_size):
+        for _ in range(self.offspring_count()):
             perm = items_ids.copy()
             random.shuffle(perm)
-            sol = Solution(perm)
-            sol.evaluate(self.instance, self.decoder, self.fitness_evaluator)
-            self.population.append(sol)
-        self.best_solution = min(self.population, key=lambda sol: sol.fitness).copy()
+            self.population.append(Solution(perm))
+        self.best_solution = None
+        self.evaluate(self.population)
+        self.update_best(self.population)
 
 
-    def evolve(self):
-        best_per_gen = []
-        worst_per_gen = []
-        avg_per_gen = []
+    def offspring_count(self) -> int:
+        """
+        Number of solutions to create in the next generation: the population size,
+        or the evaluations left in the budget if fewer (the last generation is then
+        smaller, so a run never evaluates more than max_evaluations).
+        """
+        remaining = self.budget.remaining_evaluations() if self.budget is not None else None
+        return self.population_size if remaining is None else min(self.population_size, remaining)
+
+    def evaluate(self, population: list[Solution], parents: list[Solution] | None = None,
+                 cutoff: float | None = None):
+        """Evaluates the solutions as one batch and charges them to the budget."""
+        self.evaluator.evaluate_solutions(population, parents, self.checkpoints, cutoff)
+        self.trace.charge(len(population))
+        if self.budget is not None:
+            self.budget.charge(len(population))
+
+    def update_best(self, solutions: list[Solution]):
+        """
+        Updates the best solution with the solutions of the last evaluated batch,
+        recording every improvement at the evaluation count it was found at.
+        """
+        first = self.trace.evaluations - len(solutions)
+        for k, sol in enumerate(solutions):
+            if self.best_solution is None or sol.fitness < self.best_solution.fitness:
+                self.best_solution = sol
+                self.trace.improve(sol.fitness, first + k + 1)
+
+    def set_permutations(self, permutations: "np.ndarray", parents: list[Solution] | None = None,
+                         cutoff: float | None = None):
+        """Evaluates the rows of an item-index array and makes them the current population (vectorized mode)."""
+        import numpy as np
+        population = [Solution(perm) for perm in self.item_ids[permutations].tolist()]
+        self.evaluate(population, parents, cutoff)
+        self.population = population
+        self.permutations = permutations
+        self.fitnesses = np.array([sol.rank_fitness for sol in population], dtype=float)
+
+    def replace_solution(self, k: int, solution: Solution):
+        """Puts an already evaluated solution at position k of the population."""
+        self.population[k] = solution
+        if self.vectorized:
+            index = self.instance.compiled.index
+            self.permutations[k] = [index[item_id] for item_id in solution.permutation]
+            self.fitnesses[k] = solution.rank_fitness
+
+    def cutoff_height(self, worst_parent: float) -> float | None:
+        """
+        Returns the height above which a child is not decoded to the end
+        (fixed for a whole generation, as children are evaluated in one batch).
+        Such a child (or one whose cached fitness is above the cutoff) is marked
+        `worse_than` the cutoff and ranked just above it by `rank_fitness`.
+        A tournament won by such a child has no contestant at or below the cutoff,
+        so its contestants are decoded to the end (`complete`) and ranked exactly:
+        the cutoff saves decoding without changing the course of the run.
+        """
+        if self.cutoff is None:
+            return None
+        if self.cutoff == "best":
+            return self.best_solution.fitness
+        if self.cutoff == "worst":
+            return worst_parent
+        raise ValueError(f"Unknown cutoff: {self.cutoff}")
+
+    def complete(self, solutions: list[Solution]):
+        """
+        Decodes cut-off solutions to the end, so they get their exact fitness.
+        They were already charged to the budget when they were evaluated.
+        """
+        for sol in solutions:
+            if sol.worse_than is not None:
+                count("ga/completed")
+                sol.evaluate(self.instance, self.decoder, self.fitness_evaluator,
+                             checkpoints=self.checkpoints, cache=self.cache)
+
+    def complete_tournaments(self, candidates: "np.ndarray", winners: "np.ndarray") -> bool:
+        """
+        `complete` for batched tournaments (vectorized mode): decodes the contestants of the
+        tournaments won by a cut-off solution and updates their fitnesses; True if any changed.
+        """
+        population = self.population
+        rows = [row for row, k in enumerate(winners.tolist()) if population[k].worse_than is not None]
+        if not rows:
+            return False
+        indices = sorted({k for row in rows for k in candidates[row].tolist() if population[k].worse_than is not None})
+        self.complete([population[k] for k in indices])
+        for k in indices:
+            self.fitnesses[k] = population[k].fitness
+        return True
+
+    def complete_fitnesses(self) -> list[float]:
+        """
+        Fitnesses of the solutions of the population that were not cut off; if every
+        solution was cut off, their rank fitnesses (just above the cutoff) instead.
+        """
+        fitnesses = [sol.fitness for sol in self.population if sol.worse_than is None]
+        return fitnesses or [sol.rank_fitness for sol in self.population]
+
+    def generation_stats(self) -> tuple[float, float, float]:
+        """Returns the best, worst and average fitness of the current population (cut-off children left out)."""
+        fitnesses = self.complete_fitnesses()
+        return min(fitnesses), max(fitnesses), sum(fitnesses) / len(fitnesses)
+
+    @timed("ga/generation")
+    def step(self) -> tuple[float, float, float]:
+        """Replaces the population with one generation of offspring and returns its statistics."""
+        if self.vectorized:
+            return self.step_vectorized()
+
+        new_population = []
+        parents = []
+        worst_parent = max(self.complete_fitnesses())
+        n = self.offspring_count()
+        complete = self.complete if self.cutoff is not None else None
+
+        # Generate all offspring first, then evaluate them as one batch
+        while len(new_population) < n:
+            # parent selection - tournament method
+            parent1 = tournament_selection(self.population, self.tournament_size, complete)
+            parent2 = tournament_selection(self.population, self.tournament_size, complete)
+
+            if random.random() < self.crossover_rate:
+                child_perm = ordered_crossover(parent1.permutation, parent2.permutation)
+            else:
+                # inversion_mutation returns a new list, so the parent's permutation is not shared
+                child_perm = parent1.permutation
+
+            # mutation
+            child_perm = inversion_mutation(child_perm, self.mutation_rate)
+
+            new_population.append(Solution(child_perm))
+            parents.append(parent1)
 
-        # Statistics for initial population (generation 0)
-        fitnesses = [sol.fitness for sol in self.population]
-        best_per_gen.append(min(fitnesses))
-        worst_per_gen.append(max(fitnesses))
-        avg_per_gen.append(sum(fitnesses) / len(fitnesses))
+        self.evaluate(new_population, parents, self.cutoff_height(worst_parent))
 
-        for gen in range(self.generations):
-            new_population = []
+        self.update_best(new_population)
 
-            while len(new_population) < self.population_size:
-                # parent selection - tournament method
-                parent1 = tournament_selection(self.population, self.tournament_size)
-                parent2 = tournament_selection(self.population, self.tournament_size)
+        self.population = new_population
+        return self.generation_stats()
 
-                if random.random() < self.crossover_rate:
-                    child_perm = ordered_crossover(parent1.permutation, parent2.permutation)
-                else:
-                    child_perm = parent1.permutation.copy()
+    def step_vectorized(self) -> tuple[float, float, float]:
+        """`step` with selection, crossover and mutation applied to the whole generation at once."""
+        import numpy as np
+        from .batch_operators import tournament_selection_batch, ordered_crossover_batch, inversion_mutation_batch
+        n = self.offspring_count()
+        worst_parent = max(self.complete_fitnesses())
 
-                # mutation
-                child_perm = inversion_mutation(child_perm, self.mutation_rate)
+        complete = self.complete_tournaments if self.cutoff is not None else None
 
-                # create Solution and evaluate
-                child = Solution(child_perm)
-                child.evaluate(self.instance, self.decoder, self.fitness_evaluator)
+        first = tournament_selection_batch(self.fitnesses, self.tournament_size, n, self.rng, complete)
+        second = tournament_selection_batch(self.fitnesses, self.tournament_size, n, self.rng, complete)
+        parents1 = self.permutations[first]
 
-                new_population.append(child)
-                if child.fitness < self.best_solution.fitness:
-                    self.best_solution = child.copy()
+        crossed = ordered_crossover_batch(parents1, self.permutations[second], self.rng)
+        children = np.where((self.rng.random(n) < self.crossover_rate)[:, None], crossed, parents1)
+        children = inversion_mutation_batch(children, self.mutation_rate, self.rng)
 
-            # Generation statistics
-            fitnesses = [sol.fitness for sol in new_population]
-            best_per_gen.append(min(fitnesses))
-            worst_per_gen.append(max(fitnesses))
-            avg_per_gen.append(sum(fitnesses) / len(fitnesses))
+        parents = [self.population[k] for k in first.tolist()]
+        self.set_permutations(children, parents, self.cutoff_height(worst_parent))
 
-            self.population = new_population
+        self.update_best(self.population)
+
+        return self.generation_stats()
+
+    def evolve(self, checkpoint_file=None, checkpoint_every: int = 0):
+        """
+        Evolves the population until the end of the run (continuing a restored run).
+        With checkpoint_file, the state is saved every checkpoint_every generations
+        (if > 0) and at the end of the run.
+        """
+        best_per_gen = []
+        worst_per_gen = []
+        avg_per_gen = []
+
+        if not self.history:
+            # Statistics for initial population (generation 0)
+            self.history.append(self.generation_stats())
+        while self.generations is None or self.generation < self.generations:
+            if self.budget is not None and self.budget.exhausted():
+                break
+            if self.target is not None and self.best_solution.fitness <= self.target:
+                break
+            self.history.append(self.step())
+            self.generation += 1
+            if checkpoint_file is not None and checkpoint_every and self.generation % checkpoint_every == 0:
+                save_checkpoint(self.state(), checkpoint_file)
+        if checkpoint_file is not None:
+            save_checkpoint(self.state(), checkpoint_file)
+
+        for best, worst, avg in self.history:
+            best_per_gen.append(best)
+            worst_per_gen.append(worst)
+            avg_per_gen.append(avg)
 
         return best_per_gen, worst_per_gen, avg_per_gen
+
+    def state(self) -> dict:
+        """
+        State of the run for a checkpoint: population, best solution, generation
+        counter, statistics history, convergence trace, budget and random generators.
+        """
+        state = {
+            "parameters": run_parameters(self.parameters) if self.parameters is not None else None,
+            "generation": self.generation,
+            "history": list(self.history),
+            "population": [(sol.permutation, sol.fitness, sol.worse_than) for sol in self.population],
+            "best": (self.best_solution.permutation, self.best_solution.fitness),
+            "trace": self.trace.state(),
+            "budget": self.budget.state() if self.budget is not None else None,
+            "random": random.getstate(),
+        }
+        if self.vectorized:
+            state["numpy"] = self.rng.bit_generator.state
+            state["permutations"] = self.permutations
+        return state
+
+    def restore(self, state: dict):
+        """Continues the run saved by `state` (solutions get their saved fitness without decoding)."""
+        self.generation = state["generation"]
+        self.history = list(state["history"])
+        self.population = []
+        for permutation, fitness, worse_than in state["population"]:
+            solution = Solution(permutation)
+            solution.assign(self.instance, self.decoder, fitness, worse_than)
+            self.population.append(solution)
+        permutation, fitness = state["best"]
+        self.best_solution = Solution(permutation)
+        self.best_solution.assign(self.instance, self.decoder, fitness)
+        self.trace.restore(state["trace"])
+        if self.budget is not None and state["budget"] is not None:
+            self.budget.restore(state["budget"])
+        random.setstate(state["random"])
+        if self.vectorized:
+            import numpy as np
+            self.rng.bit_generator.state = state["numpy"]
+            self.permutations = state["permutations"]
+            self.fitnesses = np.array([sol.rank_fitness for sol in self.population], dtype=float)
@@ -1,7 +1,9 @@
 import random
 from ...model.solution import Solution
+from ...instrumentation import timed
 
 
+@timed("inversion_mutation")
 def inversion_mutation(permutation: list[int], mutation_rate: float = 0.1) -> list[int]:
         new_perm = permutation.copy()
         if random.random() < mutation_rate:
@@ -10,6 +12,7 @@ def inversion_mutation(permutation: list[int], mutation_rate: float = 0.1) -> li
             new_perm[i:j+1] = new_perm[i:j+1][::-1]
         return new_perm
     
+@timed("ordered_crossover")
 def ordered_crossover(parent1: list[int], parent2: list[int]) -> list[int]:
         size = len(parent1)
         child = [None] * size
@@ -28,13 +31,20 @@ def ordered_crossover(parent1: list[int], parent2: list[int]) -> list[int]:
         return child
 
 
-def tournament_selection(population: list, k: int = 3) -> Solution:
+@timed("tournament_selection")
+def tournament_selection(population: list, k: int = 3, complete=None) -> Solution:
         """
         Tournament selection for GA.
         population: list of Solution objects
         k: tournament size
+        Returns the winner itself (not a copy); solutions are not modified by the operators.
+        Solutions are compared by `rank_fitness` (cut-off children rank just above the cutoff).
+        A cut-off winner means no contestant is at or below the cutoff: complete(tournament),
+        if given, then decodes them to the end and the exact best one wins.
         """
         tournament = random.sample(population, k)
-        winner = min(tournament, key=lambda sol: sol.fitness)
-        return winner.copy()
-
+        winner = min(tournament, key=lambda sol: sol.rank_fitness)
+        if complete is not None and winner.worse_than is not None:
+            complete(tournament)
+            winner = min(tournament, key=lambda sol: sol.rank_fitness)
+        return winner
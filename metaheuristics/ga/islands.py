@@ -0,0 +1,264 @@
+import random
+import logging
+from multiprocessing import Pipe, Process
+from ...model.solution import Solution
+from ...model.instance import BinPackingInstance
+from ...evaluation_cache import EvaluationCache
+from ...convergence import ConvergenceTrace
+from ...multi_run import run_seed, new_master_seed
+from ...utils import *
+
+from .ga import GeneticAlgorithm
+
+
+def _island_worker(conn, seed: int, instance: BinPackingInstance, decoder, fitness_evaluator,
+                   item_ids: list[int], parameters: dict, cache_size: int):
+    """
+    Process of one island. Evolves its own GeneticAlgorithm on request:
+    receives (generations, immigrants) and sends back the statistics of these
+    generations, its emigrants, its best permutation and fitness and the number
+    of evaluations so far. None stops the island.
+    An exception is sent back instead of a reply, to be raised by the main process.
+    """
+    try:
+        _evolve_island(conn, seed, instance, decoder, fitness_evaluator, item_ids, parameters, cache_size)
+    except Exception as error:
+        conn.send(error)
+    conn.close()
+
+
+def _evolve_island(conn, seed: int, instance: BinPackingInstance, decoder, fitness_evaluator,
+                   item_ids: list[int], parameters: dict, cache_size: int):
+    random.seed(seed)
+    cache = EvaluationCache(cache_size) if cache_size else None
+    ga = GeneticAlgorithm.from_parameters(instance, decoder, fitness_evaluator, parameters, cache)
+    ga.initialize_population(item_ids)
+    conn.send(([ga.generation_stats()], emigrants(ga, parameters["migrants"]),
+               (ga.best_solution.permutation, ga.best_solution.fitness), ga.trace.evaluations))
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        generations, immigrants = message
+        receive_immigrants(ga, immigrants)
+        stats = [ga.step() for _ in range(generations)]
+        conn.send((stats, emigrants(ga, parameters["migrants"]),
+                   (ga.best_solution.permutation, ga.best_solution.fitness), ga.trace.evaluations))
+
+
+def _receive(connections) -> list:
+    """Receives one reply from every island; raises the exception of a failed island."""
+    replies = [conn.recv() for conn in connections]
+    for reply in replies:
+        if isinstance(reply, Exception):
+            raise reply
+    return replies
+
+
+def emigrants(ga: GeneticAlgorithm, n: int) -> list[tuple[list[int], float]]:
+    """
+    Returns the permutations and fitnesses of the n best solutions of the population
+    (solutions whose decoding stopped at a cutoff have no exact fitness and are skipped).
+    """
+    complete = [sol for sol in ga.population if sol.worse_than is None]
+    best = sorted(complete, key=lambda sol: sol.fitness)[:n]
+    return [(sol.permutation, sol.fitness) for sol in best]
+
+
+def receive_immigrants(ga: GeneticAlgorithm, immigrants: list[tuple[list[int], float]]):
+    """
+    Replaces the worst solutions of the population with the best immigrants
+    (at most as many as the island sends out); immigrants are not decoded again.
+    """
+    if not immigrants:
+        return
+    n = min(len(immigrants), len(ga.population))
+    worst_first = sorted(range(len(ga.population)), key=lambda k: ga.population[k].rank_fitness, reverse=True)
+    for k, (permutation, fitness) in zip(worst_first, sorted(immigrants, key=lambda m: m[1])[:n]):
+        solution = Solution(permutation)
+        solution.assign(ga.instance, ga.decoder, fitness)
+        ga.replace_solution(k, solution)
+        if fitness < ga.best_solution.fitness:
+            ga.best_solution = solution
+
+
+def migration_sources(topology: str, n_islands: int) -> list[list[int]]:
+    """
+    Returns, for every island, the islands it receives emigrants from:
+    "ring" — from the previous island only, "complete" — from all other islands.
+    """
+    if topology == "ring":
+        return [[(i - 1) % n_islands] for i in range(n_islands)]
+    if topology == "complete":
+        return [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+    raise ValueError(f"Unknown topology: {topology}")
+
+
+class IslandModel:
+    """
+    Island-model GA: `islands` populations of population_size each evolve in
+    separate processes and exchange their `migrants` best permutations every
+    `migration_interval` generations over a ring or complete topology.
+    Migration is synchronous, so a run is reproducible for a given seed.
+    Only permutations and fitnesses are sent between processes.
+    The convergence trace of a run is global: the best fitness over all islands
+    against the evaluations of all islands, recorded at every migration.
+    A Budget is shared by all islands and checked at every migration: the next
+    round is shortened to the generations the evaluations left allow for every
+    island, so only the initial populations can go over max_evaluations
+    (max_time can be exceeded by at most one round).
+    """
+
+    def __init__(self, instance: BinPackingInstance, decoder, fitness_evaluator, parameters: dict,
+                 cache_size: int = 0, target: float | None = None, budget=None):
+        self.instance = instance
+        self.decoder = decoder
+        self.fitness_evaluator = fitness_evaluator
+        self.parameters = parameters
+        self.cache_size = cache_size
+        self.islands = parameters["islands"]
+        self.migration_interval = parameters.get("migration_interval", 10)
+        if self.migration_interval < 1:
+            raise ValueError(f"migration_interval must be at least 1, got {self.migration_interval}")
+        self.sources = migration_sources(parameters.get("topology", "ring"), self.islands)
+        # All islands stop at the next migration once the best fitness reaches target
+        self.target = target
+        self.budget = budget
+        self.best_solution: Solution | None = None
+        # Improvement events (time, evaluations, best fitness) of the run over all islands
+        self.trace = ConvergenceTrace()
+
+    @staticmethod
+    def run_islands(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name, cache=None, seed=None,
+                    lower_bound=None, budget=None):
+        """
+        Runs multiple executions of the island-model GA, like `GeneticAlgorithm.run_ga`.
+        Statistics of a generation are taken over all islands together.
+        Each island keeps its own in-memory cache of the size of the given cache.
+        lower_bound is reported as a gap in the CSV and, with parameters["stop_at_bound"],
+        stops a run once reached.
+        budget: Optional Budget applied to every run separately (shared by its islands).
+
+        Returns:
+            best_solution: The best Solution found among all runs.
+        """
+
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
+        logger = logging.getLogger(__name__)
+
+        if seed is None:
+            seed = new_master_seed()
+        logger.info(f"Island GA master seed: {seed}")
+
+        cache_size = cache.max_size if cache is not None else 0
+        target = lower_bound if parameters.get("stop_at_bound", False) else None
+        all_run_stats = []
+        for run_idx in range(N_RUNS):
+            model = IslandModel(instance, decoder, fitness, parameters, cache_size, target, budget)
+            bests, worsts, avgs = model.evolve(item_ids, run_seed(seed, run_idx))
+            all_run_stats.append({
+                'bests': bests,
+                'worsts': worsts,
+                'avgs': avgs,
+                'solution': model.best_solution,
+                'best_fitness': model.best_solution.fitness,
+                'trace': model.trace.events
+            })
+
+            logger.info(f"Run {run_idx+1}/{N_RUNS} completed.")
+
+        best = best_run(all_run_stats)
+        plot_convergence(best['bests'],best['worsts'],best['avgs'],f"{instance_name}/GA_islands_best_{decoder.name}_{instance_name}.png","Island GA Best Run")
+        best_index = save_ga_sa_result(all_run_stats, f'{instance_name}/GA_islands_results_{decoder.name}_{instance_name}.csv', lower_bound)
+        report_convergence([run["trace"] for run in all_run_stats], instance_name, "GA_islands", decoder.name)
+        best_solution = all_run_stats[best_index]["solution"]
+        return best_solution
+
+    def evolve(self, item_ids: list[int], seed: int):
+        """
+        Evolves all islands for the configured number of generations (fewer if the budget runs out).
+        Island i is seeded with run_seed(seed, i).
+        Returns the best, worst and average fitness per generation over all islands.
+        """
+        self.trace = ConvergenceTrace()
+        if self.budget is not None:
+            self.budget.start()
+        connections = []
+        processes = []
+        for i in range(self.islands):
+            parent_conn, child_conn = Pipe()
+            process = Process(
+                target=_island_worker,
+                args=(child_conn, run_seed(seed, i), self.instance, self.decoder, self.fitness_evaluator,
+                      item_ids, self.parameters, self.cache_size),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            connections.append(parent_conn)
+            processes.append(process)
+
+        best_per_gen = []
+        worst_per_gen = []
+        avg_per_gen = []
+        try:
+            replies = _receive(connections)
+            remaining = self.parameters["generations"]
+            while True:
+                self._record(replies, best_per_gen, worst_per_gen, avg_per_gen)
+                if remaining == 0:
+                    break
+                if self.target is not None and self.best_solution.fitness <= self.target:
+                    break
+                generations = self.round_generations(remaining)
+                if generations == 0:
+                    break
+                remaining -= generations
+
+                outgoing = [reply[1] for reply in replies]
+                for i, conn in enumerate(connections):
+                    immigrants = [m for j in self.sources[i] for m in outgoing[j]]
+                    conn.send((generations, immigrants))
+                replies = _receive(connections)
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(None)
+                except OSError:
+                    # The island already exited after sending its exception
+                    pass
+                conn.close()
+            for process in processes:
+                process.join()
+
+        return best_per_gen, worst_per_gen, avg_per_gen
+
+    def round_generations(self, remaining: int) -> int:
+        """Generations of the next round: the migration interval, cut to the generations and budget left."""
+        generations = min(self.migration_interval, remaining)
+        if self.budget is None:
+            return generations
+        if self.budget.exhausted():
+            return 0
+        left = self.budget.remaining_evaluations()
+        if left is not None:
+            generations = min(generations, left // (self.islands * self.parameters["population_size"]))
+        return generations
+
+    def _record(self, replies, best_per_gen, worst_per_gen, avg_per_gen):
+        """Merges the statistics of all islands and updates the best solution and the trace."""
+        for gen_stats in zip(*(reply[0] for reply in replies)):
+            best_per_gen.append(min(stats[0] for stats in gen_stats))
+            worst_per_gen.append(max(stats[1] for stats in gen_stats))
+            avg_per_gen.append(sum(stats[2] for stats in gen_stats) / len(gen_stats))
+
+        for _, _, (permutation, fitness), _ in replies:
+            if self.best_solution is None or fitness < self.best_solution.fitness:
+                self.best_solution = Solution(permutation)
+                self.best_solution.assign(self.instance, self.decoder, fitness)
+        evaluations = sum(reply[3] for reply in replies)
+        if self.budget is not None:
+            self.budget.charge(evaluations - self.trace.evaluations)
+        self.trace.evaluations = evaluations
+        self.trace.improve(self.best_solution.fitness)
@@ -0,0 +1,219 @@
+import random
+import math
+import logging
+from multiprocessing import Pipe, Process
+from ..model.solution import Solution
+from ..model.instance import BinPackingInstance
+from ..evaluation_cache import EvaluationCache
+from ..convergence import ConvergenceTrace
+from ..multi_run import run_seed, new_master_seed
+from ..utils import *
+
+from .sa import SimulatedAnnealing
+
+
+def _replica_worker(conn, seed: int, instance: BinPackingInstance, decoder, fitness_evaluator,
+                    item_ids: list[int], parameters: dict, cache_size: int, target: float | None):
+    """
+    Process of one replica: a SimulatedAnnealing chain whose temperature is set
+    by the master. Receives (T, iterations), sweeps at T and sends back the
+    current fitness, the best permutation and fitness of the chain and its
+    number of evaluations so far. None stops the replica.
+    """
+    random.seed(seed)
+    cache = EvaluationCache(cache_size) if cache_size else None
+    initial_perm = item_ids.copy()
+    random.shuffle(initial_perm)
+    sa = SimulatedAnnealing(
+        initial_solution=Solution(initial_perm),
+        instance=instance,
+        decoder=decoder,
+        fitness_evaluator=fitness_evaluator,
+        checkpoints=parameters.get("checkpoints", 0),
+        cache=cache,
+        early_cutoff=parameters.get("early_cutoff", False),
+        target=target
+    )
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        sa.T, iterations = message
+        sa.sweep(instance, iterations)
+        conn.send((sa.current_solution.fitness,
+                   (sa.best_solution.permutation, sa.best_solution.fitness), sa.trace.evaluations))
+    conn.close()
+
+
+def temperature_ladder(T_min: float, T_max: float, replicas: int) -> list[float]:
+    """Returns replicas temperatures spaced geometrically from T_min to T_max."""
+    if replicas == 1:
+        return [T_min]
+    ratio = (T_max / T_min) ** (1 / (replicas - 1))
+    return [T_min * ratio ** k for k in range(replicas)]
+
+
+class ParallelTempering:
+    """
+    Replica-exchange SA: `replicas` SimulatedAnnealing chains, each in its own
+    process, run at fixed temperatures of a geometric ladder from T_min to T0.
+    After every `exchange_interval` iterations, neighbouring temperatures try to
+    swap chains with probability min(1, exp((E_i - E_j) * (1/T_i - 1/T_j))).
+    Only temperatures are sent to the chains (a swap reassigns temperatures),
+    so no permutations cross processes until the end.
+    The convergence trace of a run is global: the best fitness over all chains
+    against the evaluations of all chains, recorded after every exchange round.
+    A Budget is shared by all chains and checked before every round: the round is
+    shortened to the iterations the evaluations left allow for every chain, so
+    only the initial solutions can go over max_evaluations (max_time can be
+    exceeded by at most one round).
+    """
+
+    def __init__(self, instance: BinPackingInstance, decoder, fitness_evaluator, parameters: dict,
+                 cache_size: int = 0, target: float | None = None, budget=None):
+        self.instance = instance
+        self.decoder = decoder
+        self.fitness_evaluator = fitness_evaluator
+        self.parameters = parameters
+        self.cache_size = cache_size
+        self.temperatures = temperature_ladder(parameters["T_min"], parameters["T0"], parameters["replicas"])
+        self.exchange_interval = parameters.get("exchange_interval", parameters["max_iter"])
+        self.exchanges = parameters.get("exchanges", 50)
+        # All chains stop after the exchange round in which the best fitness reaches target
+        self.target = target
+        self.budget = budget
+        self.best_solution: Solution | None = None
+        self.swap_attempts = 0
+        self.swaps = 0
+        # Improvement events (time, evaluations, best fitness) of the run over all chains
+        self.trace = ConvergenceTrace()
+
+    @staticmethod
+    def run_tempering(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name, cache=None, seed=None,
+                      lower_bound=None, budget=None):
+        """
+        Runs multiple executions of replica-exchange SA, like `SimulatedAnnealing.run_sa`.
+        Each replica keeps its own in-memory cache of the size of the given cache.
+        lower_bound is reported as a gap in the CSV and, with parameters["stop_at_bound"],
+        stops a run once reached.
+        budget: Optional Budget applied to every run separately (shared by its replicas).
+
+        Returns:
+            best_solution: The best Solution found among all runs.
+        """
+
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
+        logger = logging.getLogger(__name__)
+
+        if seed is None:
+            seed = new_master_seed()
+        logger.info(f"Parallel tempering master seed: {seed}")
+
+        cache_size = cache.max_size if cache is not None else 0
+        target = lower_bound if parameters.get("stop_at_bound", False) else None
+        all_run_stats = []
+        for run_idx in range(N_RUNS):
+            model = ParallelTempering(instance, decoder, fitness, parameters, cache_size, target, budget)
+            model.run(item_ids, run_seed(seed, run_idx))
+            all_run_stats.append({
+                "solution": model.best_solution,
+                "best_fitness": model.best_solution.fitness,
+                "trace": model.trace.events
+            })
+
+            logger.info(f"Run {run_idx+1}/{N_RUNS} completed, "
+                        f"swaps accepted: {model.swaps}/{model.swap_attempts}.")
+
+        best_index = save_ga_sa_result(all_run_stats, f"{instance_name}/SA_tempering_results_{decoder.name}_{instance_name}.csv", lower_bound)
+        report_convergence([run["trace"] for run in all_run_stats], instance_name, "SA_tempering", decoder.name)
+        best_solution = all_run_stats[best_index]["solution"]
+        return best_solution
+
+    def run(self, item_ids: list[int], seed: int) -> Solution:
+        """
+        Runs all replicas for `exchanges` rounds (fewer if the budget runs out) and returns the global best solution.
+        Replica k is seeded with run_seed(seed, k); swap decisions use their own
+        generator seeded with seed, so a run is reproducible.
+        """
+        replicas = len(self.temperatures)
+        rng = random.Random(seed)
+        self.trace = ConvergenceTrace()
+        # Every chain evaluates its initial solution when it starts
+        self.trace.charge(replicas)
+        if self.budget is not None:
+            self.budget.start()
+            self.budget.charge(replicas)
+        connections = []
+        processes = []
+        for k in range(replicas):
+            parent_conn, child_conn = Pipe()
+            process = Process(
+                target=_replica_worker,
+                args=(child_conn, run_seed(seed, k), self.instance, self.decoder, self.fitness_evaluator,
+                      item_ids, self.parameters, self.cache_size, self.target),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            connections.append(parent_conn)
+            processes.append(process)
+
+        # chain_at[t] is the replica currently running at temperatures[t]
+        chain_at = list(range(replicas))
+        try:
+            for round_idx in range(self.exchanges):
+                iterations = self.round_iterations()
+                if iterations == 0:
+                    break
+                for t, k in enumerate(chain_at):
+                    connections[k].send((self.temperatures[t], iterations))
+                replies = [conn.recv() for conn in connections]
+                self._record(replies)
+                if self.target is not None and self.best_solution.fitness <= self.target:
+                    break
+
+                # Alternate even and odd pairs of neighbouring temperatures
+                energies = [reply[0] for reply in replies]
+                for t in range(round_idx % 2, replicas - 1, 2):
+                    a, b = chain_at[t], chain_at[t + 1]
+                    exponent = (energies[a] - energies[b]) * (1 / self.temperatures[t] - 1 / self.temperatures[t + 1])
+                    self.swap_attempts += 1
+                    if exponent >= 0 or rng.random() < math.exp(exponent):
+                        chain_at[t], chain_at[t + 1] = b, a
+                        self.swaps += 1
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(None)
+                except OSError:
+                    # The replica already exited; its error is the one reported
+                    pass
+                conn.close()
+            for process in processes:
+                process.join()
+
+        return self.best_solution
+
+    def round_iterations(self) -> int:
+        """Iterations of every chain in the next round: the exchange interval, cut to the budget left."""
+        if self.budget is None:
+            return self.exchange_interval
+        if self.budget.exhausted():
+            return 0
+        left = self.budget.remaining_evaluations()
+        if left is None:
+            return self.exchange_interval
+        return min(self.exchange_interval, left // len(self.temperatures))
+
+    def _record(self, replies):
+        """Updates the global best solution and the trace with the best solutions of the replicas."""
+        for _, (permutation, fitness), _ in replies:
+            if self.best_solution is None or fitness < self.best_solution.fitness:
+                self.best_solution = Solution(permutation)
+                self.best_solution.assign(self.instance, self.decoder, fitness)
+        evaluations = sum(reply[2] for reply in replies)
+        if self.budget is not None:
+            self.budget.charge(evaluations - self.trace.evaluations)
+        self.trace.evaluations = evaluations
+        self.trace.improve(self.best_solution.fitness)
@@ -4,6 +4,11 @@ from copy import deepcopy
 from ..model.solution import Solution
 from ..model.instance import BinPackingInstance
 from ..heuristics.decoder import Decoder
+from ..budget import Budget
+from ..instrumentation import timed
+from ..convergence import ConvergenceTrace
+from ..checkpoint import checkpoint_path, checkpoint_master_seed, save_checkpoint, load_checkpoint, run_parameters
+from ..multi_run import run_independent, new_master_seed
 import logging
 from ..utils import *
 
@@ -22,7 +27,13 @@ class SimulatedAnnealing:
              T0: float = 100.0,
              T_min: float = 0.1,
              alpha: float = 0.95,
-             max_iter: int = 100):
+             max_iter: int = 100,
+             checkpoints: int = 0,
+             cache=None,
+             early_cutoff: bool = False,
+             budget: Budget | None = None,
+             schedule: str = "geometric",
+             target: float | None = None):
 
         self.decoder = decoder
         self.fitness_evaluator = fitness_evaluator
@@ -30,17 +41,42 @@ class SimulatedAnnealing:
         self.T_min = T_min
         self.alpha = alpha
         self.max_iter = max_iter
+        self.checkpoints = checkpoints
+        self.cache = cache
+        self.early_cutoff = early_cutoff
+        # Optional Budget; with schedule="budget" the temperature falls geometrically
+        # from T0 to T_min as the budget is used, instead of by alpha every max_iter
+        self.budget = budget
+        self.schedule = schedule
+        # The run stops once the best fitness reaches target (e.g. a lower bound of the instance)
+        self.target = target
+        if schedule not in ("geometric", "budget"):
+            raise ValueError(f"Unknown schedule: {schedule}")
+        if schedule == "budget" and budget is None:
+            raise ValueError("The budget schedule requires a budget")
+
+        # Improvement events (time, evaluations, best fitness) of the run
+        self.trace = ConvergenceTrace()
+        # Completed temperature steps (sweeps)
+        self.steps = 0
+        # sa_parameters the run was created from (stored with checkpoints)
+        self.parameters: dict | None = None
 
         # Evaluate initial solution
         if not initial_solution.is_evaluated():
-            initial_solution.evaluate(instance, decoder, fitness_evaluator)
+            initial_solution.evaluate(instance, decoder, fitness_evaluator, checkpoints=checkpoints, cache=cache)
+            self.trace.charge()
+            if budget is not None:
+                budget.charge()
 
         self.current_solution = initial_solution.copy()
         self.best_solution = initial_solution.copy()
+        self.trace.improve(self.best_solution.fitness)
 
 
     @staticmethod
-    def run_sa(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name):
+    def run_sa(instance, decoder, fitness, item_ids, N_RUNS, parameters, instance_name, cache=None,
+               run_workers=1, seed=None, budget=None, lower_bound=None):
         """
         Runs multiple executions of the Simulated Annealing (SA) algorithm for the 2D Bin Packing problem.
         For each run, it shuffles the item permutation, executes the SA algorithm, and records the best solution found.
@@ -51,6 +87,14 @@ class SimulatedAnnealing:
             fitness: Fitness function to evaluate solutions.
             item_ids: List of item IDs to be packed.
             N_RUNS: Number of independent SA runs.
+            cache: Optional EvaluationCache shared by all runs.
+            run_workers: Number of processes executing whole runs in parallel (1 = serial).
+            seed: Master seed; run k is seeded with run_seed(seed, k) (None = random seed, logged).
+            budget: Optional Budget applied to every run separately.
+            lower_bound: Optional lower bound of the instance, reported as a gap in the CSV;
+                with parameters["stop_at_bound"] a run stops once it reaches the bound.
+            With parameters["checkpoint_every"] or parameters["resume"], every run keeps a
+            checkpoint in {instance_name}/checkpoints; resuming without a seed reuses the saved master seed.
 
         Returns:
             best_solution: The best Solution found among all runs.
@@ -60,34 +104,82 @@ class SimulatedAnnealing:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
         logger = logging.getLogger(__name__)
 
-        all_run_stats = []
-        for run_idx in range(N_RUNS):
-            initial_perm = item_ids.copy()
-            random.shuffle(initial_perm)
-
-            sa = SimulatedAnnealing(
-                initial_solution=Solution(initial_perm),
-                instance=instance,
-                decoder=decoder,
-                fitness_evaluator=fitness,
-                T0=parameters["T0"],
-                T_min=parameters["T_min"],
-                alpha=parameters["alpha"],
-                max_iter=parameters["max_iter"]
-            )
-            best_solution_run = sa.run(instance)
-
-            all_run_stats.append({
-            "solution": best_solution_run,
-            "best_fitness": best_solution_run.fitness
-            })
+        target = lower_bound if parameters.get("stop_at_bound", False) else None
+        checkpoint_dir = None
+        if parameters.get("checkpoint_every", 0) or parameters.get("resume", False):
+            checkpoint_dir = f"{instance_name}/checkpoints"
+            # Checkpoints are found by the run seeds, so a resumed run reuses the saved master seed
+            seed = checkpoint_master_seed(checkpoint_dir, "SA", decoder.name, seed,
+                                          parameters.get("resume", False))
+        elif seed is None:
+            seed = new_master_seed()
+        logger.info(f"SA master seed: {seed}")
 
+        runs = run_independent(SimulatedAnnealing.single_run, N_RUNS, seed,
+                               (instance, decoder, fitness, item_ids, parameters, budget, target,
+                                checkpoint_dir),
+                               workers=run_workers, cache=cache)
+        all_run_stats = []
+        for run_idx, stats in enumerate(runs):
+            stats["solution"] = Solution(stats.pop("permutation"))
+            stats["solution"].assign(instance, decoder, stats["best_fitness"])
+            all_run_stats.append(stats)
             logger.info(f"Run {run_idx+1}/{N_RUNS} completed.")
 
-        best_index = save_ga_sa_result(all_run_stats, f"{instance_name}/SA_results_{decoder.name}_{instance_name}.csv")
+        best_index = save_ga_sa_result(all_run_stats, f"{instance_name}/SA_results_{decoder.name}_{instance_name}.csv", lower_bound)
+        report_convergence([run["trace"] for run in all_run_stats], instance_name, "SA", decoder.name)
         best_solution = all_run_stats[best_index]["solution"]
         return best_solution
 
+    @staticmethod
+    def single_run(seed, cache, instance, decoder, fitness, item_ids, parameters, budget=None,
+                   target=None, checkpoint_dir=None) -> dict:
+        """
+        Executes one SA run with the random generator seeded with seed (and the budget restarted).
+        With checkpoint_dir, the run is checkpointed every parameters["checkpoint_every"]
+        temperature steps and, with parameters["resume"], continues from its last checkpoint.
+        Returns the best permutation and fitness (plain values, so the result
+        can be sent back from a worker process).
+        """
+        random.seed(seed)
+        if budget is not None:
+            budget.start()
+        initial_perm = item_ids.copy()
+        random.shuffle(initial_perm)
+
+        sa = SimulatedAnnealing(
+            initial_solution=Solution(initial_perm),
+            instance=instance,
+            decoder=decoder,
+            fitness_evaluator=fitness,
+            T0=parameters["T0"],
+            T_min=parameters["T_min"],
+            alpha=parameters["alpha"],
+            max_iter=parameters["max_iter"],
+            checkpoints=parameters.get("checkpoints", 0),
+            cache=cache,
+            early_cutoff=parameters.get("early_cutoff", False),
+            budget=budget,
+            schedule=parameters.get("schedule", "geometric"),
+            target=target
+        )
+        sa.parameters = parameters
+        checkpoint_file = None
+        if checkpoint_dir is not None:
+            checkpoint_file = checkpoint_path(checkpoint_dir, "SA", decoder.name, seed)
+            if parameters.get("resume", False):
+                state = load_checkpoint(checkpoint_file, parameters)
+                if state is not None:
+                    sa.restore(state, instance)
+        best_solution_run = sa.run(instance, checkpoint_file, parameters.get("checkpoint_every", 0),
+                                   parameters["T0"])
+        return {
+            "permutation": best_solution_run.permutation,
+            "best_fitness": best_solution_run.fitness,
+            "trace": sa.trace.events
+        }
+
+    @timed("sa/neighbor")
     def neighbor(self, solution: Solution) -> Solution:
         """
         Generates a neighbor solution using inversion mutation.
@@ -101,32 +193,134 @@ class SimulatedAnnealing:
         new_solution = Solution(perm)
         return new_solution
 
-    def accept(self, delta: float) -> bool:
+    @timed("sa/accept")
+    def accept(self, delta: float, draw: float | None = None) -> bool:
         """
         Accept worse solution with probability exp(-delta / T)
+        draw: random number in [0, 1) drawn in advance (drawn here if None)
         """
         if delta < 0:
             return True
         else:
             probability = math.exp(-delta / self.T)
-            return random.random() < probability
+            if draw is None:
+                draw = random.random()
+            return draw < probability
+
+    def acceptance_cutoff(self, draw: float) -> float | None:
+        """
+        Returns the fitness above which a candidate is rejected for the given draw.
+        accept(delta, draw) holds only for delta < -T * ln(draw).
+        """
+        if draw <= 0:
+            return None
+        return self.current_solution.fitness - self.T * math.log(draw)
 
-    def run(self, instance: BinPackingInstance) -> Solution:
+    def run(self, instance: BinPackingInstance, checkpoint_file=None, checkpoint_every: int = 0,
+            T0: float | None = None) -> Solution:
+        """
+        Anneals until the end of the run (continuing a restored run).
+        With checkpoint_file, the state is saved every checkpoint_every temperature
+        steps (if > 0) and at the end of the run.
+        T0: initial temperature of the budget schedule (default: the current temperature).
+        """
         if self.current_solution.fitness is None:
-            self.current_solution.evaluate(instance, self.decoder, self.fitness_evaluator)
+            self.current_solution.evaluate(instance, self.decoder, self.fitness_evaluator,
+                                           checkpoints=self.checkpoints, cache=self.cache)
+
+        if self.schedule == "budget":
+            T0 = self.T if T0 is None else T0
+            while not self.budget.exhausted() and not self.reached_target():
+                self.T = T0 * (self.T_min / T0) ** self.budget.used()
+                self.sweep(instance, self.max_iter)
+                self.step_done(checkpoint_file, checkpoint_every)
+        else:
+            while self.T > self.T_min:
+                if self.budget is not None and self.budget.exhausted():
+                    break
+                if self.reached_target():
+                    break
+                self.sweep(instance, self.max_iter)
+                self.T *= self.alpha
+                self.step_done(checkpoint_file, checkpoint_every)
+
+        if checkpoint_file is not None:
+            save_checkpoint(self.state(), checkpoint_file)
+        return self.best_solution
+
+    def step_done(self, checkpoint_file, checkpoint_every: int):
+        """Counts a temperature step and saves a checkpoint every checkpoint_every steps."""
+        self.steps += 1
+        if checkpoint_file is not None and checkpoint_every and self.steps % checkpoint_every == 0:
+            save_checkpoint(self.state(), checkpoint_file)
+
+    def state(self) -> dict:
+        """
+        State of the run for a checkpoint: current and best solutions, temperature,
+        step counter, convergence trace, budget and random generator.
+        """
+        return {
+            "parameters": run_parameters(self.parameters) if self.parameters is not None else None,
+            "steps": self.steps,
+            "T": self.T,
+            "current": (self.current_solution.permutation, self.current_solution.fitness),
+            "best": (self.best_solution.permutation, self.best_solution.fitness),
+            "trace": self.trace.state(),
+            "budget": self.budget.state() if self.budget is not None else None,
+            "random": random.getstate(),
+        }
+
+    def restore(self, state: dict, instance: BinPackingInstance):
+        """Continues the run saved by `state` (solutions get their saved fitness without decoding)."""
+        self.steps = state["steps"]
+        self.T = state["T"]
+        solutions = []
+        for permutation, fitness in (state["current"], state["best"]):
+            solution = Solution(permutation)
+            solution.assign(instance, self.decoder, fitness)
+            solutions.append(solution)
+        self.current_solution, self.best_solution = solutions
+        self.trace.restore(state["trace"])
+        if self.budget is not None and state["budget"] is not None:
+            self.budget.restore(state["budget"])
+        random.setstate(state["random"])
+
+    def reached_target(self) -> bool:
+        """Returns True if the best fitness has reached the target."""
+        return self.target is not None and self.best_solution.fitness <= self.target
+
+    @timed("sa/temperature_step")
+    def sweep(self, instance: BinPackingInstance, iterations: int):
+        """
+        Performs the given number of neighbor/accept iterations at the current temperature
+        (fewer if the budget runs out or the target is reached).
+        """
+        for _ in range(iterations):
+            if self.budget is not None and self.budget.exhausted():
+                break
+            if self.reached_target():
+                break
+            candidate = self.neighbor(self.current_solution)
 
-        while self.T > self.T_min:
-            for _ in range(self.max_iter):
-                candidate = self.neighbor(self.current_solution)
-                candidate.evaluate(instance, self.decoder, self.fitness_evaluator)
+            # Draw the acceptance number first, so that decoding can stop
+            # as soon as the candidate is certain to be rejected
+            draw = random.random() if self.early_cutoff else None
+            cutoff = self.acceptance_cutoff(draw) if self.early_cutoff else None
 
-                delta = candidate.fitness - self.current_solution.fitness
+            candidate.evaluate(instance, self.decoder, self.fitness_evaluator,
+                               parent=self.current_solution, checkpoints=self.checkpoints,
+                               cache=self.cache, cutoff=cutoff)
+            self.trace.charge()
+            if self.budget is not None:
+                self.budget.charge()
 
-                if self.accept(delta):
-                    self.current_solution = candidate
-                    if candidate.fitness < self.best_solution.fitness:
-                        self.best_solution = candidate.copy()
+            if candidate.worse_than is not None:
+                continue
 
-            self.T *= self.alpha
+            delta = candidate.fitness - self.current_solution.fitness
 
-        return self.best_solution
\ No newline at end of file
+            if self.accept(delta, draw):
+                self.current_solution = candidate
+                if candidate.fitness < self.best_solution.fitness:
+                    self.best_solution = candidate
+                    self.trace.improve(candidate.fitness)
@@ -0,0 +1,55 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from math import ceil
+
+
+def _is_integral(values) -> bool:
+    return all(float(v).is_integer() for v in values)
+
+
+def _round_up(value: float, integral: bool) -> float:
+    """Rounds a bound up to an integer when all item heights are integers (the optimum is then integral)."""
+    if integral:
+        return ceil(value - 1e-9)
+    return value
+
+
+def area_bound(bin_width: float, widths: list[float], heights: list[float]) -> float:
+    """Continuous bound: total item area divided by the strip width."""
+    return _round_up(sum(w * h for w, h in zip(widths, heights)) / bin_width, _is_integral(heights))
+
+
+def height_bound(heights: list[float]) -> float:
+    """The tallest item."""
+    return max(heights, default=0)
+
+
+def mmv_bound(bin_width: float, widths: list[float], heights: list[float]) -> float:
+    """
+    Martello-Monaci-Vigo bound L(alpha), maximized over alpha in the widths not above W/2.
+    Items wider than W/2 (J1, J2) cannot stand side by side, so their heights add up.
+    Items with alpha <= w <= W/2 (J3) cannot fit next to items wider than W - alpha (J1)
+    and at best fill the free width (W - w) * h next to the items of J2; the rest
+    of their area needs additional height.
+    """
+    W = bin_width
+    integral = _is_integral(heights)
+    order = sorted(range(len(widths)), key=lambda k: widths[k])
+    sorted_widths = [widths[k] for k in order]
+    prefix_heights = [0] + list(accumulate(heights[k] for k in order))
+    prefix_areas = [0] + list(accumulate(widths[k] * heights[k] for k in order))
+    prefix_free = [0] + list(accumulate((W - widths[k]) * heights[k] for k in order))
+
+    half = bisect_right(sorted_widths, W / 2)
+    wide_height = prefix_heights[-1] - prefix_heights[half]
+    best = wide_height
+
+    for alpha in sorted(set(sorted_widths[:half])):
+        j2_end = bisect_right(sorted_widths, W - alpha)
+        j3_start = bisect_left(sorted_widths, alpha)
+        j2_free = prefix_free[j2_end] - prefix_free[half]
+        j3_area = prefix_areas[half] - prefix_areas[j3_start]
+        extra = max(0, _round_up((j3_area - j2_free) / W, integral))
+        best = max(best, wide_height + extra)
+
+    return best
@@ -0,0 +1,213 @@
+from array import array
+from .item import Item
+
+
+def _typecode(values) -> str:
+    """Returns 'q' for all-integer values and 'd' otherwise."""
+    return "q" if all(isinstance(v, int) for v in values) else "d"
+
+
+class CompiledInstance:
+    """
+    Immutable struct-of-arrays form of a BinPackingInstance.
+    Item i (in instance order) has ids[i], widths[i], heights[i], areas[i];
+    index maps an item id to i. Items with the same width and height share
+    an item type: types[i] is its number (0..n_types-1, in order of first
+    appearance). Built once per instance and shared by all decodes; it
+    pickles as a few flat arrays.
+    """
+
+    __slots__ = ("bin_width", "bin_height", "ids", "widths", "heights", "areas", "index", "items",
+                 "types", "n_types", "_type_of_id", "_integer_dimensions")
+
+    def __init__(self, bin_width: float, bin_height: float, items: list[Item]):
+        self.bin_width = bin_width
+        self.bin_height = bin_height
+        self.items: tuple[Item, ...] = tuple(items)
+        self.ids = array("q", [item.id for item in items])
+
+        widths = [item.width for item in items]
+        heights = [item.height for item in items]
+        self.widths = array(_typecode(widths), widths)
+        self.heights = array(_typecode(heights), heights)
+        areas = [w * h for w, h in zip(widths, heights)]
+        self.areas = array(_typecode(areas), areas)
+
+        self.index: dict[int, int] = {item_id: i for i, item_id in enumerate(self.ids)}
+        self._build_types()
+        self._integer_dimensions = None
+
+    def _build_types(self):
+        type_numbers: dict[tuple[float, float], int] = {}
+        self.types = array("q", [type_numbers.setdefault((w, h), len(type_numbers))
+                                 for w, h in zip(self.widths, self.heights)])
+        self.n_types = len(type_numbers)
+        self._type_of_id = dict(zip(self.ids, self.types))
+
+    @property
+    def has_identical_items(self) -> bool:
+        """True if at least two items have the same width and height."""
+        return self.n_types < len(self.ids)
+
+    def type_sequence(self, permutation: list[int]) -> array:
+        """
+        Canonical form of a permutation of item ids: the sequence of item types.
+        Decoders only look at item sizes, so permutations with the same type
+        sequence (differing only by swapped identical items) decode to the same packing shape.
+        """
+        type_of_id = self._type_of_id
+        return array("q", [type_of_id[item_id] for item_id in permutation])
+
+    def type_counts(self) -> list[int]:
+        """Multiplicity of every item type."""
+        counts = [0] * self.n_types
+        for t in self.types:
+            counts[t] += 1
+        return counts
+
+    @property
+    def has_integer_dimensions(self) -> bool:
+        """True if the strip width and every item width and height are whole numbers; checked once."""
+        if self._integer_dimensions is None:
+            values = [self.bin_width, *self.widths, *self.heights]
+            self._integer_dimensions = all(float(v).is_integer() for v in values)
+        return self._integer_dimensions
+
+    @property
+    def typecode(self) -> str:
+        """Array typecode able to hold every coordinate of a packing."""
+        if self.widths.typecode == "q" and self.heights.typecode == "q" and isinstance(self.bin_width, int):
+            return "q"
+        return "d"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getstate__(self):
+        return (self.bin_width, self.bin_height, self.ids, self.widths, self.heights, self.areas)
+
+    def __setstate__(self, state):
+        self.bin_width, self.bin_height, self.ids, self.widths, self.heights, self.areas = state
+        self.index = {item_id: i for i, item_id in enumerate(self.ids)}
+        self.items = tuple(Item(item_id, w, h) for item_id, w, h in zip(self.ids, self.widths, self.heights))
+        self._build_types()
+        self._integer_dimensions = None
+
+    def __repr__(self) -> str:
+        return f"CompiledInstance(bin=({self.bin_width}x{self.bin_height}), items={len(self.ids)})"
+
+
+class PlacementBuffer:
+    """
+    Placements stored as arrays: the item index and the x, y of every placed
+    item, in placement order. Indexing or iterating creates `PlacementView`
+    objects on demand, so the buffer can be used wherever a list of
+    placements is read.
+    """
+
+    __slots__ = ("compiled", "order", "xs", "ys")
+
+    def __init__(self, compiled: CompiledInstance):
+        self.compiled = compiled
+        self.order = array("q")
+        self.xs = array(compiled.typecode)
+        self.ys = array(compiled.typecode)
+
+    def append(self, index: int, x: float, y: float):
+        self.order.append(index)
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def copy(self) -> "PlacementBuffer":
+        new_buffer = PlacementBuffer.__new__(PlacementBuffer)
+        new_buffer.compiled = self.compiled
+        new_buffer.order = array("q", self.order)
+        new_buffer.xs = array(self.xs.typecode, self.xs)
+        new_buffer.ys = array(self.ys.typecode, self.ys)
+        return new_buffer
+
+    def max_top(self) -> float:
+        """Returns the highest top edge of the placed items (0 if empty)."""
+        heights = self.compiled.heights
+        return max((y + heights[i] for i, y in zip(self.order, self.ys)), default=0)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [PlacementView(self, i) for i in range(*k.indices(len(self.order)))]
+        if k < 0:
+            k += len(self.order)
+        if not 0 <= k < len(self.order):
+            raise IndexError("placement index out of range")
+        return PlacementView(self, k)
+
+    def __iter__(self):
+        for k in range(len(self.order)):
+            yield PlacementView(self, k)
+
+    def __repr__(self) -> str:
+        return f"PlacementBuffer({len(self.order)} placements)"
+
+
+class PlacementView:
+    """Read-only view of one placement in a `PlacementBuffer`, with the attributes of `Placement`."""
+
+    __slots__ = ("buffer", "k")
+
+    def __init__(self, buffer: PlacementBuffer, k: int):
+        self.buffer = buffer
+        self.k = k
+
+    @property
+    def item(self) -> Item:
+        return self.buffer.compiled.items[self.buffer.order[self.k]]
+
+    @property
+    def id(self) -> int:
+        return self.buffer.compiled.ids[self.buffer.order[self.k]]
+
+    @property
+    def x(self) -> float:
+        return self.buffer.xs[self.k]
+
+    @property
+    def y(self) -> float:
+        return self.buffer.ys[self.k]
+
+    @property
+    def width(self) -> float:
+        return self.buffer.compiled.widths[self.buffer.order[self.k]]
+
+    @property
+    def height(self) -> float:
+        return self.buffer.compiled.heights[self.buffer.order[self.k]]
+
+    @property
+    def area(self) -> float:
+        return self.buffer.compiled.areas[self.buffer.order[self.k]]
+
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+
+    @property
+    def top(self) -> float:
+        return self.y + self.height
+
+    def intersects(self, other) -> bool:
+        """Checks whether this placement overlaps another placement."""
+        return not (
+            self.right <= other.x or
+            other.right <= self.x or
+            self.top <= other.y or
+            other.top <= self.y
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Placement(item={self.id}, "
+            f"x={self.x}, y={self.y}, "
+            f"w={self.width}, h={self.height}, "
+        )
@@ -1,10 +1,21 @@
 from .item import Item
+from .compiled import CompiledInstance
+from .bounds import area_bound, height_bound, mmv_bound
 
 class BinPackingInstance:
     def __init__(self, bin_width: float, bin_height: float, items: list[Item]):
         self.bin_width = bin_width
         self.bin_height = bin_height
         self.items = items
+        self._compiled: CompiledInstance | None = None
+        self._lower_bound: float | None = None
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledInstance) -> "BinPackingInstance":
+        """Rebuilds an instance around an existing compiled form (e.g. in a worker process)."""
+        instance = cls(compiled.bin_width, compiled.bin_height, list(compiled.items))
+        instance._compiled = compiled
+        return instance
 
     def __repr__(self):
         return f"BinPackingInstance(bin=({self.bin_width}x{self.bin_height}), items={len(self.items)})"
@@ -15,4 +26,28 @@ class BinPackingInstance:
     @property
     def num_items(self):
         return len(self.items)
-    
\ No newline at end of file
+
+    @property
+    def compiled(self) -> CompiledInstance:
+        """Struct-of-arrays form of the instance, built on first use (items must not change afterwards)."""
+        if self._compiled is None:
+            self._compiled = CompiledInstance(self.bin_width, self.bin_height, self.items)
+        return self._compiled
+    
+    def area_bound(self) -> float:
+        """Continuous lower bound ceil(sum(area) / W) (no rounding for non-integer heights)."""
+        return area_bound(self.bin_width, [i.width for i in self.items], [i.height for i in self.items])
+
+    def height_bound(self) -> float:
+        """Lower bound given by the tallest item."""
+        return height_bound([i.height for i in self.items])
+
+    def mmv_bound(self) -> float:
+        """Martello-Monaci-Vigo lower bound based on items wider than half of the strip."""
+        return mmv_bound(self.bin_width, [i.width for i in self.items], [i.height for i in self.items])
+
+    def lower_bound(self) -> float:
+        """Best of the lower bounds on the strip height, computed once."""
+        if self._lower_bound is None:
+            self._lower_bound = max(self.area_bound(), self.height_bound(), self.mmv_bound())
+        return self._lower_bound
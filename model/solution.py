@@ -1,36 +1,167 @@
-from copy import deepcopy
+import math
 from .instance import BinPackingInstance
 from .placement import Placement
-from ..heuristics.decoder import Decoder
+from ..heuristics.decoder import Decoder, Checkpoints
+from ..instrumentation import timed, count
 
 class Solution():
+    """
+    A permutation of items together with its fitness.
+    Placements are not kept after evaluation: they are decoded again on first
+    access (e.g. for the final best solution or for visualization).
+    Permutations and placements are never modified in place, so copies share them.
+    """
+
     def __init__(self, permutation: list[int]):
         self.permutation: list[int] = permutation
-        self.placements: list[Placement] = []
+        self._placements: list[Placement] | None = None
+        # Instance and decoder used to re-materialize placements
+        self._context: tuple[BinPackingInstance, Decoder] | None = None
         self.fitness: float | None = None
         self.decoder_name: str | None = None
         self.evaluated: bool = False
+        self.checkpoints: Checkpoints | None = None
+        # Set when the fitness is known to exceed a cutoff (decoding stopped there, or the
+        # cached fitness is above it): fitness is then not comparable, see rank_fitness
+        self.worse_than: float | None = None
+
+    @property
+    def placements(self) -> list[Placement]:
+        """Placements of the solution, decoded on first access."""
+        if self._placements is None:
+            if self._context is None:
+                return []
+            self.materialize(*self._context)
+        return self._placements
+
+    @property
+    def rank_fitness(self) -> float:
+        """
+        Fitness used to rank solutions. A solution above a cutoff ranks just above
+        the cutoff, whether it was cut off while decoding or its full fitness came
+        from the cache, so both give the same selection.
+        """
+        if self.worse_than is None:
+            return self.fitness
+        return math.nextafter(self.worse_than, math.inf)
 
+    @placements.setter
+    def placements(self, placements: list[Placement] | None):
+        self._placements = placements
+
+    @timed("solution_copy")
     def copy(self):
-        new_solution = Solution(self.permutation.copy())
-        new_solution.placements = deepcopy(self.placements)
+        new_solution = Solution(self.permutation)
+        new_solution._placements = self._placements
+        new_solution._context = self._context
         new_solution.fitness = self.fitness
         new_solution.decoder_name = self.decoder_name
         new_solution.evaluated = self.evaluated
+        new_solution.checkpoints = self.checkpoints
+        new_solution.worse_than = self.worse_than
         return new_solution
 
 
-    def evaluate(self, instance: BinPackingInstance, decoder: Decoder, fitness_evaluator):
+    @timed("evaluate")
+    def evaluate(self, instance: BinPackingInstance, decoder: Decoder, fitness_evaluator,
+                 parent: "Solution | None" = None, checkpoints: int = 0, cache=None,
+                 cutoff: float | None = None):
         """
         The algorithm decodes the permutation into placements, computes the fitness
-        value based on these placements, and stores both the placements and the
-        fitness value in the solution object.
+        value based on these placements, and stores the fitness value in the
+        solution object (placements are decoded again when accessed).
+        With checkpoints > 0, up to that many intermediate decoder states are kept
+        on the solution; if the parent solution shares a prefix of the permutation,
+        decoding resumes from the parent's nearest checkpoint.
+        If an EvaluationCache is given and already knows the permutation (or one
+        differing only by swapped identical items), only the fitness is taken from it.
+        A child whose permutation only swaps identical items of the parent (a no-op
+        move) gets the parent's fitness without decoding.
+        With a cutoff height, decoding stops once the packing reaches above it;
+        the solution is then marked as `worse_than` the cutoff and its fitness
+        is the height of the partial packing (a lower bound). A cached fitness
+        above the cutoff is marked the same way.
         """
-        self.placements = decoder.decode(instance, self.permutation)
-        self.fitness = fitness_evaluator.evaluate(self.placements)
+        self._placements = None
+        self._context = (instance, decoder)
+
+        if parent is not None and self.same_packing_as(parent, instance, decoder, cutoff):
+            count("evaluate/identical_items")
+            self.assign(instance, decoder, parent.fitness)
+            # The decoder states only depend on the item sizes, so they are valid for this permutation too
+            self.checkpoints = parent.checkpoints
+            return
+
+        key = None
+        if cache is not None:
+            key = cache.key(decoder.name, self.permutation, instance.compiled)
+            fitness = cache.get(key)
+            if fitness is not None:
+                count("evaluate/cache_hit")
+                self.assign(instance, decoder, fitness,
+                            cutoff if cutoff is not None and fitness > cutoff else None)
+                return
+
+        if checkpoints > 0:
+            resume = None
+            prefix = 0
+            if parent is not None and parent.checkpoints is not None and parent.decoder_name == decoder.name:
+                resume = parent.checkpoints
+                prefix = self.common_prefix(parent.permutation)
+            placements, self.checkpoints = decoder.decode_resumable(
+                instance, self.permutation, checkpoints, resume, prefix, cutoff)
+        else:
+            placements = decoder.decode(instance, self.permutation, cutoff)
+        truncated = len(placements) < len(self.permutation)
+        if truncated:
+            count("evaluate/truncated")
+        self.fitness = fitness_evaluator.evaluate(placements)
+        # Also when only the last item reached above the cutoff (a complete, exact packing)
+        self.worse_than = cutoff if truncated or (cutoff is not None and self.fitness > cutoff) else None
         self.decoder_name = decoder.name
         self.evaluated = True
+        if key is not None and not truncated:
+            cache.put(key, self.fitness)
+
+    def assign(self, instance: BinPackingInstance, decoder: Decoder, fitness: float,
+               worse_than: float | None = None):
+        """Stores a fitness computed elsewhere (cache, worker process) for this permutation."""
+        self._placements = None
+        self._context = (instance, decoder)
+        self.checkpoints = None
+        self.worse_than = worse_than
+        self.fitness = fitness
+        self.decoder_name = decoder.name
+        self.evaluated = True
+
+    def materialize(self, instance: BinPackingInstance, decoder: Decoder):
+        """Decodes and stores the full placements if they are not stored yet."""
+        if self._placements is None or len(self._placements) != len(self.permutation):
+            self._placements = decoder.decode(instance, self.permutation)
+
+
+    def same_packing_as(self, other: "Solution", instance: BinPackingInstance, decoder: Decoder,
+                        cutoff: float | None = None) -> bool:
+        """
+        True if other was fully evaluated by the same decoder (within the cutoff) and its
+        permutation differs from this one only by swapped identical items.
+        """
+        if (not other.evaluated or other.worse_than is not None or other.decoder_name != decoder.name
+                or (cutoff is not None and other.fitness > cutoff)):
+            return False
+        if other.permutation == self.permutation:
+            return True
+        compiled = instance.compiled
+        return (compiled.has_identical_items
+                and compiled.type_sequence(self.permutation) == compiled.type_sequence(other.permutation))
 
+    def common_prefix(self, permutation: list[int]) -> int:
+        """Returns the number of leading positions equal in both permutations."""
+        n = min(len(self.permutation), len(permutation))
+        for k in range(n):
+            if self.permutation[k] != permutation[k]:
+                return k
+        return n
 
     def is_evaluated(self) -> bool:
         """Returns True if the solution has been evaluated."""
@@ -39,6 +170,6 @@ class Solution():
     def __repr__(self) -> str:
         return (
             f"Solution(fitness={self.fitness}, "
-            f"placements={len(self.placements)} items, "
+            f"placements={len(self.permutation)} items, "
             f"decoder={self.decoder_name})"
         )
\ No newline at end of file
@@ -0,0 +1,54 @@
+import random
+from hashlib import blake2b
+from .evaluation_cache import EvaluationCache
+
+
+# Evaluation cache of a pool worker, set once by _init_worker
+_worker: dict = {}
+
+
+def _init_worker(cache_size: int):
+    _worker["cache"] = EvaluationCache(cache_size) if cache_size else None
+
+
+def _run_in_worker(run_fn, seed: int, args: tuple):
+    return run_fn(seed, _worker["cache"], *args)
+
+
+def run_seed(master_seed: int, run_idx: int) -> int:
+    """Returns the seed of run run_idx, derived from the master seed only."""
+    digest = blake2b(f"{master_seed}:{run_idx}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+def new_master_seed() -> int:
+    """Returns a random master seed (to be logged, so the runs can be repeated)."""
+    return random.SystemRandom().randrange(2**63)
+
+
+def run_independent(run_fn, n_runs: int, master_seed: int, args: tuple = (),
+                    workers: int = 1, cache: EvaluationCache | None = None):
+    """
+    Executes n_runs independent runs and yields their results in run order.
+    Each call is run_fn(seed, cache, *args), where seed comes from `run_seed`,
+    so results do not depend on the number of workers or on the order in which
+    runs finish. run_fn must seed its random generator with it.
+    With workers > 1 the runs are spread over a process pool; run_fn and args
+    must then be picklable, and every worker keeps its own in-memory cache of
+    the same size as the given one (the SQLite tier stays in this process).
+    """
+    seeds = [run_seed(master_seed, run_idx) for run_idx in range(n_runs)]
+
+    if workers <= 1:
+        for seed in seeds:
+            yield run_fn(seed, cache, *args)
+        return
+
+    cache_size = cache.max_size if cache is not None else 0
+    # Imported here, so the serial loop above never loads the process pool machinery
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_size,)) as pool:
+        futures = [pool.submit(_run_in_worker, run_fn, seed, args) for seed in seeds]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,71 @@
+import random
+from pathlib import Path
+import pytest
+from ..batch_evaluator import BatchEvaluator
+from ..data.loader import load_beng_instance
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.ga import GeneticAlgorithm
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+PARAMETERS = {
+    "population_size": 30,
+    "generations": 15,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "checkpoints": 8,
+}
+
+
+def identical_swaps(instance, permutation) -> list[list[int]]:
+    """Copies of the permutation with one pair of identical items swapped (same type sequence)."""
+    compiled = instance.compiled
+    types = compiled.type_sequence(permutation)
+    swaps = []
+    for i in range(len(permutation)):
+        for j in range(i + 1, len(permutation)):
+            if types[i] == types[j]:
+                swapped = permutation.copy()
+                swapped[i], swapped[j] = swapped[j], swapped[i]
+                swaps.append(swapped)
+    return swaps
+
+
+def ga_run(workers, cutoff) -> dict:
+    instance = load_beng_instance(INSTANCE_PATH)
+    item_ids = [item.id for item in instance.items]
+    decoder = get_decoder(4)
+    fitness = HeightFitnessEvaluator()
+    parameters = {**PARAMETERS, "cutoff": cutoff}
+    with BatchEvaluator(instance, decoder, fitness, workers=workers) as evaluator:
+        return GeneticAlgorithm.single_run(0, None, instance, decoder, fitness, item_ids, parameters, evaluator)
+
+
+def test_instance_has_identical_items():
+    assert load_beng_instance(INSTANCE_PATH).compiled.has_identical_items
+
+
+@pytest.mark.parametrize("cutoff", [None, 20])
+def test_pool_matches_serial(cutoff):
+    instance = load_beng_instance(INSTANCE_PATH)
+    decoder = get_decoder(4)
+    rng = random.Random(0)
+    permutations = []
+    for _ in range(10):
+        permutation = [item.id for item in instance.items]
+        rng.shuffle(permutation)
+        permutations.append(permutation)
+        permutations.extend(identical_swaps(instance, permutation)[:3])
+
+    serial = BatchEvaluator(instance, decoder, HeightFitnessEvaluator(), workers=1)
+    with BatchEvaluator(instance, decoder, HeightFitnessEvaluator(), workers=2) as pool:
+        assert pool.evaluate_many(permutations, cutoff) == serial.evaluate_many(permutations, cutoff)
+
+
+@pytest.mark.parametrize("cutoff", [None, "best", "worst"])
+def test_ga_pool_matches_serial(cutoff):
+    serial, pool = ga_run(1, cutoff), ga_run(2, cutoff)
+    for key in ("best_fitness", "permutation", "bests", "worsts", "avgs"):
+        assert pool[key] == serial[key]
+    assert [event[1:] for event in pool["trace"]] == [event[1:] for event in serial["trace"]]
@@ -0,0 +1,60 @@
+import random
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance
+from ..heuristics.bottom_left_fill import BottomLeftFill, rect_intersects, split_rect, prune_rects
+from ..model.instance import BinPackingInstance
+from ..model.item import Item
+from ..model.placement import Placement
+
+BENG_PATHS = sorted((Path(__file__).resolve().parent.parent / "data" / "BENG").glob("*.ins2D"))
+N_PERMUTATIONS = 3
+N_RANDOM_INSTANCES = 100
+
+
+def rebuild_placements(instance, permutation) -> list[tuple]:
+    """Bottom-Left-Fill that splits every free rectangle and prunes the whole list after each item."""
+    items = {item.id: item for item in instance.items}
+    free_rects = [(0, 0, instance.bin_width, BottomLeftFill.INF)]
+    placements = []
+    for item_id in permutation:
+        item = items[item_id]
+        fitting = [r for r in free_rects if item.width <= r[2] and item.height <= r[3]]
+        if fitting:
+            best = min(fitting, key=lambda r: (r[1], r[0]))
+        else:
+            best = (0, max((p.top for p in placements), default=0), instance.bin_width, BottomLeftFill.INF)
+            free_rects.append(best)
+        placement = Placement(item, best[0], best[1])
+        placements.append(placement)
+        new_free = []
+        for r in free_rects:
+            new_free.extend(split_rect(r, placement) if rect_intersects(r, placement) else [r])
+        free_rects = prune_rects(new_free)
+    return [(p.item.id, p.x, p.y) for p in placements]
+
+
+def incremental_placements(instance, permutation) -> list[tuple]:
+    return [(p.item.id, p.x, p.y) for p in BottomLeftFill().decode(instance, permutation)]
+
+
+@pytest.mark.parametrize("path", BENG_PATHS, ids=[p.stem for p in BENG_PATHS])
+def test_same_placements_as_full_rebuild(path):
+    instance = load_beng_instance(str(path))
+    rng = random.Random(path.stem)
+    for _ in range(N_PERMUTATIONS):
+        permutation = [item.id for item in instance.items]
+        rng.shuffle(permutation)
+        assert incremental_placements(instance, permutation) == rebuild_placements(instance, permutation)
+
+
+def test_same_placements_on_random_instances():
+    rng = random.Random(0)
+    for _ in range(N_RANDOM_INSTANCES):
+        bin_width = rng.randint(5, 30)
+        items = [Item(item_id, rng.randint(1, bin_width), rng.randint(1, 15))
+                 for item_id in range(1, rng.randint(2, 40))]
+        instance = BinPackingInstance(bin_width, -1, items)
+        permutation = [item.id for item in items]
+        rng.shuffle(permutation)
+        assert incremental_placements(instance, permutation) == rebuild_placements(instance, permutation)
@@ -0,0 +1,24 @@
+import random
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance
+from ..heuristics.bottomleft import BottomLeft
+from ..heuristics.bottom_left_indexed import IndexedBottomLeft
+
+BENG_PATHS = sorted((Path(__file__).resolve().parent.parent / "data" / "BENG").glob("*.ins2D"))
+N_PERMUTATIONS = 3
+
+
+def placements(decoder, instance, permutation) -> list[tuple]:
+    return [(p.item.id, p.x, p.y) for p in decoder.decode(instance, permutation)]
+
+
+@pytest.mark.parametrize("path", BENG_PATHS, ids=[p.stem for p in BENG_PATHS])
+def test_same_placements_as_bottom_left(path):
+    instance = load_beng_instance(str(path))
+    rng = random.Random(path.stem)
+    for _ in range(N_PERMUTATIONS):
+        permutation = [item.id for item in instance.items]
+        rng.shuffle(permutation)
+        assert placements(IndexedBottomLeft(), instance, permutation) == \
+            placements(BottomLeft(), instance, permutation)
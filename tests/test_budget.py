@@ -0,0 +1,56 @@
+from pathlib import Path
+import pytest
+from ..budget import Budget
+from ..data.loader import load_beng_instance
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.islands import IslandModel
+from ..metaheuristics.parallel_tempering import ParallelTempering
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+ISLAND_PARAMETERS = {
+    "population_size": 10,
+    "generations": 1000,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "islands": 3,
+    "migration_interval": 5,
+    "migrants": 2,
+    "topology": "ring",
+}
+TEMPERING_PARAMETERS = {
+    "T0": 50,
+    "T_min": 1,
+    "max_iter": 20,
+    "replicas": 4,
+    "exchange_interval": 20,
+    "exchanges": 1000,
+}
+
+
+@pytest.mark.parametrize("max_evaluations", [0, -5])
+def test_max_evaluations_must_be_positive(max_evaluations):
+    with pytest.raises(ValueError):
+        Budget(max_evaluations=max_evaluations)
+
+
+@pytest.mark.parametrize("max_evaluations", [100, 1234])
+def test_islands_stop_within_budget(max_evaluations):
+    instance = load_beng_instance(INSTANCE_PATH)
+    budget = Budget(max_evaluations=max_evaluations)
+    model = IslandModel(instance, get_decoder(4), HeightFitnessEvaluator(), ISLAND_PARAMETERS, budget=budget)
+    model.evolve([item.id for item in instance.items], seed=0)
+    generation = ISLAND_PARAMETERS["islands"] * ISLAND_PARAMETERS["population_size"]
+    assert max_evaluations - generation < model.trace.evaluations <= max_evaluations
+    assert budget.evaluations == model.trace.evaluations
+
+
+@pytest.mark.parametrize("max_evaluations", [100, 1234])
+def test_tempering_stops_within_budget(max_evaluations):
+    instance = load_beng_instance(INSTANCE_PATH)
+    budget = Budget(max_evaluations=max_evaluations)
+    model = ParallelTempering(instance, get_decoder(4), HeightFitnessEvaluator(), TEMPERING_PARAMETERS, budget=budget)
+    model.run([item.id for item in instance.items], seed=0)
+    assert max_evaluations - TEMPERING_PARAMETERS["replicas"] < model.trace.evaluations <= max_evaluations
+    assert budget.evaluations == model.trace.evaluations
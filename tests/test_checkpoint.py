@@ -0,0 +1,104 @@
+from pathlib import Path
+import pytest
+from ..budget import Budget
+from ..data.loader import load_beng_instance
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics import sa as sa_module
+from ..metaheuristics.ga import ga as ga_module
+from ..metaheuristics.ga.ga import GeneticAlgorithm
+from ..metaheuristics.sa import SimulatedAnnealing
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+SEED = 7
+GA_PARAMETERS = {
+    "population_size": 20,
+    "generations": 12,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "checkpoints": 8,
+}
+SA_PARAMETERS = {
+    "T0": 50,
+    "T_min": 1,
+    "alpha": 0.8,
+    "max_iter": 20,
+    "checkpoints": 8,
+}
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(module, monkeypatch, counter: str, k: int):
+    """Makes the run stop (as if killed) right after saving its checkpoint at generation/step k."""
+    save_checkpoint = module.save_checkpoint
+
+    def save_and_stop(state, path):
+        save_checkpoint(state, path)
+        if state[counter] == k:
+            raise Interrupted()
+
+    monkeypatch.setattr(module, "save_checkpoint", save_and_stop)
+
+
+def course(result: dict) -> tuple:
+    """Best fitness, best permutation, per-generation statistics and improvements (without their times)."""
+    statistics = tuple(result.get(key) for key in ("bests", "worsts", "avgs"))
+    return result["best_fitness"], result["permutation"], statistics, [event[1:] for event in result["trace"]]
+
+
+def single_run(run_fn, parameters, checkpoint_dir=None, budget=None) -> dict:
+    instance = load_beng_instance(INSTANCE_PATH)
+    item_ids = [item.id for item in instance.items]
+    return run_fn(SEED, None, instance, get_decoder(4), HeightFitnessEvaluator(), item_ids, parameters,
+                  budget=budget, checkpoint_dir=checkpoint_dir)
+
+
+def resumed_run(run_fn, module, counter, parameters, k, tmp_path, monkeypatch, budget=None) -> dict:
+    """Runs until the checkpoint at generation/step k, then resumes the run from it."""
+    with monkeypatch.context() as patch:
+        interrupt_after(module, patch, counter, k)
+        with pytest.raises(Interrupted):
+            single_run(run_fn, {**parameters, "checkpoint_every": k}, tmp_path, budget)
+
+    loaded = []
+    load_checkpoint = module.load_checkpoint
+
+    def load_and_record(path, run_parameters):
+        state = load_checkpoint(path, run_parameters)
+        loaded.append(state[counter])
+        return state
+
+    monkeypatch.setattr(module, "load_checkpoint", load_and_record)
+    result = single_run(run_fn, {**parameters, "checkpoint_every": k, "resume": True}, tmp_path, budget)
+    assert loaded == [k]
+    return result
+
+
+@pytest.mark.parametrize("overrides", [{}, {"vectorized": True}, {"cutoff": "best"}])
+@pytest.mark.parametrize("k", [1, 5])
+def test_resumed_ga_run_is_identical(overrides, k, tmp_path, monkeypatch):
+    parameters = {**GA_PARAMETERS, **overrides}
+    expected = course(single_run(GeneticAlgorithm.single_run, parameters))
+    resumed = resumed_run(GeneticAlgorithm.single_run, ga_module, "generation", parameters, k, tmp_path, monkeypatch)
+    assert course(resumed) == expected
+
+
+def test_resumed_ga_run_keeps_its_budget(tmp_path, monkeypatch):
+    parameters = {**GA_PARAMETERS, "generations": None}
+    expected = course(single_run(GeneticAlgorithm.single_run, parameters, budget=Budget(max_evaluations=150)))
+    resumed = resumed_run(GeneticAlgorithm.single_run, ga_module, "generation", parameters, 3, tmp_path,
+                          monkeypatch, Budget(max_evaluations=150))
+    assert course(resumed) == expected
+
+
+@pytest.mark.parametrize("overrides", [{}, {"early_cutoff": True}])
+@pytest.mark.parametrize("k", [1, 4])
+def test_resumed_sa_run_is_identical(overrides, k, tmp_path, monkeypatch):
+    parameters = {**SA_PARAMETERS, **overrides}
+    expected = course(single_run(SimulatedAnnealing.single_run, parameters))
+    resumed = resumed_run(SimulatedAnnealing.single_run, sa_module, "steps", parameters, k, tmp_path, monkeypatch)
+    assert course(resumed) == expected
@@ -0,0 +1,44 @@
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance
+from ..evaluation_cache import EvaluationCache
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.ga import GeneticAlgorithm
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+SEEDS = range(4)
+PARAMETERS = {
+    "population_size": 30,
+    "generations": 30,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "checkpoints": 8,
+}
+
+
+def ga_run(seed, cutoff, vectorized, cache=None) -> dict:
+    instance = load_beng_instance(INSTANCE_PATH)
+    item_ids = [item.id for item in instance.items]
+    parameters = {**PARAMETERS, "cutoff": cutoff, "vectorized": vectorized}
+    return GeneticAlgorithm.single_run(seed, cache, instance, get_decoder(4), HeightFitnessEvaluator(),
+                                       item_ids, parameters)
+
+
+def course(result: dict) -> tuple:
+    """Best fitness, best permutation and the evaluations/fitness of every improvement (not their times)."""
+    return result["best_fitness"], result["permutation"], [event[1:] for event in result["trace"]]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+@pytest.mark.parametrize("cutoff", ["best", "worst"])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_cutoff_does_not_change_the_run(seed, cutoff, vectorized):
+    assert course(ga_run(seed, cutoff, vectorized)) == course(ga_run(seed, None, vectorized))
+
+
+@pytest.mark.parametrize("cutoff", ["best", "worst"])
+def test_cutoff_with_cache(cutoff):
+    expected = course(ga_run(0, None, False))
+    assert course(ga_run(0, cutoff, False, EvaluationCache(10_000))) == expected
@@ -0,0 +1,44 @@
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.islands import IslandModel
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG01.ins2D"
+PARAMETERS = {
+    "population_size": 10,
+    "generations": 6,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "islands": 2,
+    "migration_interval": 3,
+    "migrants": 2,
+    "topology": "ring",
+}
+
+
+def island_model(**parameters) -> IslandModel:
+    instance = load_beng_instance(INSTANCE_PATH)
+    return IslandModel(instance, get_decoder(4), HeightFitnessEvaluator(), {**PARAMETERS, **parameters})
+
+
+def test_migration_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        island_model(migration_interval=0)
+
+
+def test_island_exception_is_raised():
+    model = island_model(tournament_size=100)
+    item_ids = [item.id for item in model.instance.items]
+    with pytest.raises(ValueError, match="larger than population"):
+        model.evolve(item_ids, seed=0)
+
+
+def test_evolve_is_reproducible():
+    model = island_model()
+    item_ids = [item.id for item in model.instance.items]
+    first = model.evolve(item_ids, seed=0)
+    assert island_model().evolve(item_ids, seed=0) == first
+    assert len(first[0]) == PARAMETERS["generations"] + 1
@@ -0,0 +1,63 @@
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance, load_dataset, parse_instance_array, instance_from_array, expand_demand
+from ..model.item import Item
+
+BENG_DIR = Path(__file__).resolve().parent.parent / "data" / "BENG"
+BENG_PATHS = sorted(BENG_DIR.glob("*.ins2D"))
+
+
+def items(instance) -> list[tuple]:
+    return [(item.id, item.width, item.height, item.demand, item.max_copies, item.profit) for item in instance.items]
+
+
+def same_instance(a, b) -> bool:
+    return (a.bin_width, a.bin_height, items(a)) == (b.bin_width, b.bin_height, items(b))
+
+
+@pytest.mark.parametrize("path", BENG_PATHS, ids=lambda path: path.stem)
+def test_loaders_agree(path):
+    assert same_instance(instance_from_array(parse_instance_array(path)), load_beng_instance(path))
+
+
+def test_dataset_agrees_with_loader(tmp_path):
+    # The second load reads the memory-mapped cache written by the first
+    for _ in range(2):
+        dataset = load_dataset(BENG_DIR, cache_dir=tmp_path)
+        assert list(dataset) == [path.stem for path in BENG_PATHS]
+        for path in BENG_PATHS:
+            assert same_instance(dataset[path.stem], load_beng_instance(path))
+
+
+def test_extra_columns_are_ignored(tmp_path):
+    source = BENG_PATHS[0].read_text().splitlines()
+    path = tmp_path / "extra.ins2D"
+    path.write_text("\n".join(source[:2] + [line + " 7" for line in source[2:]]) + "\n")
+    assert same_instance(instance_from_array(parse_instance_array(path)), load_beng_instance(BENG_PATHS[0]))
+    assert same_instance(load_beng_instance(path), load_beng_instance(BENG_PATHS[0]))
+
+
+def test_missing_fields_are_rejected(tmp_path):
+    source = BENG_PATHS[0].read_text().splitlines()
+    path = tmp_path / "short.ins2D"
+    path.write_text("\n".join(source[:2] + [" ".join(line.split()[:5]) for line in source[2:]]) + "\n")
+    with pytest.raises(ValueError):
+        parse_instance_array(path)
+
+
+def test_expand_demand():
+    originals = [Item(1, 4, 2, 3, 3, 0), Item(2, 5, 5, 1, 1, 0), Item(5, 1, 1, 2, 2, 0)]
+    expanded = expand_demand(originals)
+    assert [(item.id, item.width, item.height, item.demand) for item in expanded] == [
+        (1, 4, 2, 1), (2, 5, 5, 1), (5, 1, 1, 1), (6, 4, 2, 1), (7, 4, 2, 1), (8, 1, 1, 1)]
+
+
+def test_expand_demand_leaves_out_zero_demand():
+    originals = [Item(1, 4, 2, 1, 1, 0), Item(2, 5, 5, 0, 1, 0), Item(3, 1, 1, 1, 1, 0)]
+    assert [item.id for item in expand_demand(originals)] == [1, 3]
+    assert [item.id for item in expand_demand(originals + [Item(4, 2, 2, 2, 2, 0)])] == [1, 3, 4, 5]
+
+
+def test_unit_demand_is_unchanged():
+    originals = [Item(1, 4, 2, 1, 1, 0), Item(2, 5, 5, 1, 1, 0)]
+    assert expand_demand(originals) is originals
@@ -0,0 +1,46 @@
+from pathlib import Path
+import pytest
+from ..data.loader import load_beng_instance
+from ..evaluation_cache import EvaluationCache
+from ..fitness import HeightFitnessEvaluator
+from ..metaheuristics.ga.ga import GeneticAlgorithm
+from ..metaheuristics.sa import SimulatedAnnealing
+from ..multi_run import run_independent
+from ..utils import get_decoder
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+MASTER_SEED = 12345
+N_RUNS = 4
+GA_PARAMETERS = {
+    "population_size": 20,
+    "generations": 10,
+    "mutation_rate": 0.1,
+    "crossover_size": 0.7,
+    "tournament_size": 3,
+    "checkpoints": 8,
+}
+SA_PARAMETERS = {
+    "T0": 50,
+    "T_min": 1,
+    "alpha": 0.8,
+    "max_iter": 20,
+    "checkpoints": 8,
+}
+
+
+def best_solutions(run_fn, parameters, run_workers, cache=None) -> list:
+    instance = load_beng_instance(INSTANCE_PATH)
+    item_ids = [item.id for item in instance.items]
+    args = (instance, get_decoder(4), HeightFitnessEvaluator(), item_ids, parameters)
+    return [(run["best_fitness"], run["permutation"])
+            for run in run_independent(run_fn, N_RUNS, MASTER_SEED, args, workers=run_workers, cache=cache)]
+
+
+@pytest.mark.parametrize("run_fn, parameters", [
+    (GeneticAlgorithm.single_run, GA_PARAMETERS),
+    (SimulatedAnnealing.single_run, SA_PARAMETERS),
+])
+def test_run_workers_do_not_change_results(run_fn, parameters):
+    serial = best_solutions(run_fn, parameters, 1)
+    assert best_solutions(run_fn, parameters, 2) == serial
+    assert best_solutions(run_fn, parameters, 2, EvaluationCache(10_000)) == serial
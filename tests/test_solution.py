@@ -0,0 +1,73 @@
+from pathlib import Path
+from ..batch_evaluator import BatchEvaluator
+from ..data.loader import load_beng_instance
+from ..fitness import HeightFitnessEvaluator
+from ..model.solution import Solution
+from ..utils import get_decoder
+from .test_batch_evaluator import identical_swaps
+
+INSTANCE_PATH = Path(__file__).resolve().parent.parent / "data" / "BENG" / "BENG06.ins2D"
+
+
+def counting_decoder(choice: int):
+    """A decoder whose decode calls are counted in its `calls` attribute."""
+    decoder = get_decoder(choice)
+    decode = decoder.decode
+    decoder.calls = 0
+
+    def counted(*args, **kwargs):
+        decoder.calls += 1
+        return decode(*args, **kwargs)
+
+    decoder.decode = counted
+    return decoder
+
+
+def evaluated_parent(instance, decoder) -> Solution:
+    parent = Solution([item.id for item in instance.items])
+    parent.evaluate(instance, decoder, HeightFitnessEvaluator())
+    return parent
+
+
+def test_identical_swap_skips_decoding():
+    instance = load_beng_instance(INSTANCE_PATH)
+    decoder = counting_decoder(4)
+    parent = evaluated_parent(instance, decoder)
+    decoder.calls = 0
+    for permutation in identical_swaps(instance, parent.permutation):
+        child = Solution(permutation)
+        child.evaluate(instance, decoder, HeightFitnessEvaluator(), parent=parent)
+        assert child.fitness == parent.fitness
+        assert child.worse_than is None
+    assert decoder.calls == 0
+
+    different = Solution(list(reversed(parent.permutation)))
+    different.evaluate(instance, decoder, HeightFitnessEvaluator(), parent=parent)
+    assert decoder.calls == 1
+
+
+def test_identical_swap_skips_decoding_in_pool():
+    instance = load_beng_instance(INSTANCE_PATH)
+    decoder = get_decoder(4)
+    parent = evaluated_parent(instance, decoder)
+    children = [Solution(permutation) for permutation in identical_swaps(instance, parent.permutation)]
+    decoded = []
+    with BatchEvaluator(instance, decoder, HeightFitnessEvaluator(), workers=2) as evaluator:
+        decode_remote = evaluator._decode_remote
+        evaluator._decode_remote = lambda permutations, cutoff: decoded.extend(permutations) or decode_remote(permutations, cutoff)
+        evaluator.evaluate_solutions(children, [parent] * len(children))
+    assert decoded == []
+    assert all(child.fitness == parent.fitness for child in children)
+
+
+def test_cut_off_parent_is_not_reused():
+    instance = load_beng_instance(INSTANCE_PATH)
+    decoder = counting_decoder(4)
+    parent = Solution([item.id for item in instance.items])
+    parent.evaluate(instance, decoder, HeightFitnessEvaluator(), cutoff=10)
+    assert parent.worse_than == 10
+    decoder.calls = 0
+    child = Solution(identical_swaps(instance, parent.permutation)[0])
+    child.evaluate(instance, decoder, HeightFitnessEvaluator(), parent=parent)
+    assert decoder.calls == 1
+    assert child.worse_than is None
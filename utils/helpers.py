@@ -1,5 +1,7 @@
 from ..heuristics.bottomleft import BottomLeft
 from ..heuristics.bottom_left_fill import BottomLeftFill
+from ..heuristics.bottom_left_indexed import IndexedBottomLeft
+from ..heuristics.skyline import Skyline
 from ..model.solution import Solution
 
 __all__ = ["get_decoder", "print_solution"]
@@ -8,16 +10,26 @@ def get_decoder(choice: int):
 	"""
 	Returns a decoder object based on the given choice.
 	Args:
-		choice (int): 1 for BottomLeft, 2 for BottomLeftFill.
+		choice (int): 1 for BottomLeft, 2 for BottomLeftFill,
+			3 for IndexedBottomLeft (same placements as BottomLeft, faster),
+			4 for Skyline, 5 for HeightMap (integer dimensions only).
 	Returns:
 		Decoder object.
 	Raises:
-		ValueError: If choice is not 1 or 2.
+		ValueError: If choice is not between 1 and 5.
 	"""
 	if choice == 1:
 		return BottomLeft()
 	elif choice == 2:
 		return BottomLeftFill()
+	elif choice == 3:
+		return IndexedBottomLeft()
+	elif choice == 4:
+		return Skyline()
+	elif choice == 5:
+		# Imported on demand: HeightMap is the only decoder using numpy
+		from ..heuristics.height_map import HeightMap
+		return HeightMap()
 	else:
 		raise ValueError(f"Unknown decoder")
 
@@ -1,10 +1,16 @@
-import matplotlib.pyplot as plt
-import numpy as np
+from ..instrumentation import timed
+from ..convergence import anytime_curve, time_to_target
 
-__all__ = ["plot_convergence", "plot_mean_convergence"]
+# matplotlib and numpy are imported when a figure is drawn, so that importing
+# the solvers (which star-import utils) does not load them
+__all__ = ["plot_convergence", "plot_mean_convergence", "plot_time_to_target"]
 
+AXIS_LABELS = ["Time [s]", "Evaluations"]
 
+
+@timed("write/plot_convergence")
 def plot_convergence(bests, worsts, avgs, path, title):
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(10,6))
     plt.plot(bests, label="Best")
     plt.plot(worsts, label="Worst")
@@ -17,8 +23,59 @@ def plot_convergence(bests, worsts, avgs, path, title):
     plt.savefig(path)
     # plt.close()
 
-def plot_mean_convergence(all_runs, path):
-    mean_best = np.mean(all_runs, axis=0)
-    plt.plot(mean_best)
+@timed("write/plot_mean_convergence")
+def plot_mean_convergence(all_runs, path, title="Mean anytime best", axis=1, points=200):
+    """
+    all_runs: improvement traces of the runs (lists of (time, evaluations, best fitness) events)
+    Plots the mean best-so-far fitness over the runs, with the range between the best
+    and the worst run, against evaluations (axis=1) or wall time (axis=0).
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    end = max((run[-1][axis] for run in all_runs if run), default=0)
+    grid = np.linspace(0, end, points)
+    curves = np.array([[np.nan if best is None else best for best in anytime_curve(run, grid, axis)]
+                       for run in all_runs], dtype=float)
+    # Only points already reached by every run
+    valid = ~np.isnan(curves).any(axis=0)
+
+    plt.figure(figsize=(10,6))
+    plt.plot(grid[valid], curves[:, valid].mean(axis=0), label="Mean best")
+    plt.fill_between(grid[valid], curves[:, valid].min(axis=0), curves[:, valid].max(axis=0),
+                     alpha=0.2, label="Best-worst run")
+    plt.xlabel(AXIS_LABELS[axis])
+    plt.ylabel("Fitness")
+    plt.title(title)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+@timed("write/plot_time_to_target")
+def plot_time_to_target(runs_by_label: dict, targets, path, title="Time to target", axis=0):
+    """
+    runs_by_label: {label: improvement traces of the runs} (e.g. one entry per method)
+    Plots, for every label and target, the empirical cumulative distribution of the
+    time (axis=0) or evaluations (axis=1) needed to reach the target; runs that never
+    reach it keep the curve below 1.
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    plt.figure(figsize=(10,6))
+    for label, runs in runs_by_label.items():
+        for target in targets:
+            reached = [time_to_target(run, target) for run in runs]
+            hits = sorted(hit[axis] for hit in reached if hit is not None)
+            if not hits:
+                continue
+            fractions = np.arange(1, len(hits) + 1) / len(runs)
+            plt.step([0] + hits, [0] + list(fractions), where="post", label=f"{label}, fitness <= {target}")
+    plt.xlabel(AXIS_LABELS[axis])
+    plt.ylabel("Fraction of runs")
+    plt.ylim(0, 1.05)
+    plt.title(title)
+    plt.legend()
+    plt.tight_layout()
     plt.savefig(path)
     plt.close()
@@ -1,79 +1,152 @@
-import numpy as np
 import csv
+import statistics
+from ..instrumentation import timed
+from ..convergence import time_to_target
+from .plot_utils import plot_mean_convergence, plot_time_to_target
 
-__all__ = ["best_run", "save_random_results", "save_greedy_result", "save_ga_sa_result"]
+__all__ = ["best_run", "save_random_results", "save_greedy_result", "save_ga_sa_result", "gap",
+           "save_traces", "report_convergence"]
 
 def best_run(run_results: list[dict]) -> dict:
     return min(run_results, key=lambda r: r['best_fitness'])
 
 
 
-def save_random_results(run_fitnesses, file_path: str, best_permutation: list[int] = None):
+def gap(fitness: float, lower_bound: float) -> float:
+    """Relative gap of a fitness above the lower bound, in percent."""
+    if lower_bound <= 0:
+        return 0.0
+    return round(100 * (fitness - lower_bound) / lower_bound, 2)
+
+
+@timed("write/save_random_results")
+def save_random_results(run_fitnesses, file_path: str, best_permutation: list[int] = None, lower_bound: float = None):
     """
     run_fitnesses: list of fitness values from multiple runs of RandomGenerator
     best_permutation: permutacja najlepszego wyniku (opcjonalnie)
+    lower_bound: dolne ograniczenie instancji (opcjonalnie); zapisywane z luką najlepszego wyniku
     Saves best, worst, mean, std to CSV. Jeśli podano permutację najlepszego wyniku, zapisuje ją również.
     """
-    best = np.min(run_fitnesses)
-    worst = np.max(run_fitnesses)
-    mean = np.mean(run_fitnesses)
-    std = np.std(run_fitnesses)
+    best = min(run_fitnesses)
+    worst = max(run_fitnesses)
+    mean = statistics.fmean(run_fitnesses)
+    std = statistics.pstdev(run_fitnesses)
+
+    header = ["Best", "Worst", "Mean", "Std"]
+    row = [best, worst, round(mean,2), round(std,2)]
+    if lower_bound is not None:
+        header += ["Lower bound", "Gap [%]"]
+        row += [lower_bound, gap(best, lower_bound)]
 
     with open(file_path, mode='w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(["Best", "Worst", "Mean", "Std"])
-        writer.writerow([best, worst, round(mean,2), round(std,2)])
+        writer.writerow(header)
+        writer.writerow(row)
         if best_permutation is not None:
             writer.writerow([])
             writer.writerow(["Best permutation"])
             writer.writerow(best_permutation)
 
-def save_greedy_result(fitness, file_path: str, permutation: list[int] =None):
+@timed("write/save_greedy_result")
+def save_greedy_result(fitness, file_path: str, permutation: list[int] =None, lower_bound: float = None):
     """
     fitness: single value from GreedyGenerator
     permutation: permutacja najlepszego wyniku (opcjonalnie)
+    lower_bound: dolne ograniczenie instancji (opcjonalnie); zapisywane z luką wyniku
     """
+    header = ["Fitness"]
+    row = [fitness]
+    if lower_bound is not None:
+        header += ["Lower bound", "Gap [%]"]
+        row += [lower_bound, gap(fitness, lower_bound)]
+
     with open(file_path, mode='w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(["Fitness"])
-        writer.writerow([fitness])
+        writer.writerow(header)
+        writer.writerow(row)
         if permutation is not None:
             writer.writerow([])
             writer.writerow(["Best permutation"])
             writer.writerow(permutation)
 
 
-def save_ga_sa_result(all_run_stats: list[dict], csv_filename: str) -> int:
+@timed("write/save_ga_sa_result")
+def save_ga_sa_result(all_run_stats: list[dict], csv_filename: str, lower_bound: float = None) -> int:
     """
     Calculates statistics for a list of runs, saves them to a CSV file, and returns the index of the best run.
 
     Args:
         all_run_stats: List of dictionaries, each containing {"solution": Solution, "fitness": float}
         csv_filename: Path to the output CSV file
+        lower_bound: Optional lower bound of the instance; the gap of the best run and of every run is saved too
 
     Returns:
         index_best: Index of the best run in the list
     """
     fitness_list = [run["best_fitness"] for run in all_run_stats]
 
-    best_f = np.min(fitness_list)
-    worst_f = np.max(fitness_list)
-    mean_f = np.mean(fitness_list)
-    std_f = np.std(fitness_list)
+    best_f = min(fitness_list)
+    worst_f = max(fitness_list)
+    mean_f = statistics.fmean(fitness_list)
+    std_f = statistics.pstdev(fitness_list)
 
-    index_best = int(np.argmin(fitness_list))
+    index_best = fitness_list.index(best_f)
     best_permutation = all_run_stats[index_best]["solution"].permutation
 
+    header = ["Best", "Worst", "Mean", "Std"]
+    row = [best_f, worst_f, round(mean_f,2), round(std_f,2)]
+    runs = [[i] for i in fitness_list]
+    if lower_bound is not None:
+        header += ["Lower bound", "Gap [%]"]
+        row += [lower_bound, gap(best_f, lower_bound)]
+        runs = [[i, gap(i, lower_bound)] for i in fitness_list]
+
     # Zapis do CSV
     with open(csv_filename, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(["Best", "Worst", "Mean", "Std"])
-        writer.writerow([best_f, worst_f, round(mean_f,2), round(std_f,2)])
+        writer.writerow(header)
+        writer.writerow(row)
         writer.writerow([])
         writer.writerow(["Best results list"])
-        writer.writerows([[i] for i in fitness_list])
+        writer.writerows(runs)
         writer.writerow([])
         writer.writerow(["Best permutation"])
         writer.writerow(best_permutation)
 
     return index_best
+
+
+@timed("write/save_traces")
+def save_traces(all_runs: list[list[tuple]], csv_filename: str, targets: list[float] = ()):
+    """
+    Saves the improvement events of every run and, for every target, the
+    time and evaluations each run needed to reach it (empty if never reached).
+    """
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Run", "Time [s]", "Evaluations", "Best"])
+        for run_idx, events in enumerate(all_runs):
+            for time, evaluations, fitness in events:
+                writer.writerow([run_idx + 1, round(time, 6), evaluations, fitness])
+        for target in targets:
+            writer.writerow([])
+            writer.writerow([f"Time to target {target}", "Time [s]", "Evaluations"])
+            for run_idx, events in enumerate(all_runs):
+                hit = time_to_target(events, target)
+                writer.writerow([run_idx + 1] + ([round(hit[0], 6), hit[1]] if hit else ["", ""]))
+
+
+def report_convergence(all_runs: list[list[tuple]], instance_name: str, method: str, decoder_name: str):
+    """
+    Convergence report of the runs of one method: the traces with times to target
+    (CSV), the mean anytime curve and the time-to-target ECDF. Targets are the
+    best, median and worst final fitness over the runs.
+    """
+    finals = sorted(events[-1][2] for events in all_runs if events)
+    if not finals:
+        return
+    targets = sorted({finals[0], finals[len(finals) // 2], finals[-1]})
+    suffix = f"{decoder_name}_{instance_name}"
+    save_traces(all_runs, f"{instance_name}/{method}_traces_{suffix}.csv", targets)
+    plot_mean_convergence(all_runs, f"{instance_name}/{method}_anytime_{suffix}.png", f"{method} mean anytime best")
+    plot_time_to_target({method: all_runs}, targets, f"{instance_name}/{method}_ttt_{suffix}.png", f"{method} time to target")
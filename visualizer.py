@@ -1,23 +1,28 @@
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
 from typing import List
 from .model.placement import Placement
+from .model.compiled import PlacementBuffer
+from .instrumentation import timed
 
 class Visualizer:
     """Visualizes a 2D Strip Packing solution."""
 
     @staticmethod
-    def draw_solution(placements: List[Placement], bin_width: float, filename: str = "solution.png", best_fitness: float = None, metaheuristic_name: str = "", heuristic_name: str = ""):
+    @timed("write/draw_solution")
+    def draw_solution(placements: List[Placement] | PlacementBuffer, bin_width: float, filename: str = "solution.png", best_fitness: float = None, metaheuristic_name: str = "", heuristic_name: str = ""):
         """
         Draws the solution and optionally saves it to a file.
-        :param placements: list of Placement objects
+        :param placements: list of Placement objects or a PlacementBuffer
         :param bin_width: width of the bin (strip)
         :param filename: if given, saves figure to file
         :param best_fitness: (optional) best fitness value to display on the plot
         """
+        # Imported here, so that only drawing pays for loading matplotlib
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Rectangle
+
         fig, ax = plt.subplots()
 
-        max_height = max((p.y + p.item.height for p in placements), default=0)
+        max_height = max((p.top for p in placements), default=0)
         ax.set_xlim(0, bin_width)
         ax.set_ylim(0, max_height + 1)
 
@@ -31,14 +36,14 @@ class Visualizer:
 
         for p in placements:
             rect = Rectangle(
-                (p.x, p.y), p.item.width, p.item.height,
+                (p.x, p.y), p.width, p.height,
                 edgecolor='black', facecolor='skyblue', alpha=0.7
             )
             ax.add_patch(rect)
             ax.text(
-                p.x + p.item.width / 2,
-                p.y + p.item.height / 2,
-                str(p.item.id),
+                p.x + p.width / 2,
+                p.y + p.height / 2,
+                str(p.id),
                 color='black', fontsize=8, ha='center', va='center'
             )
 